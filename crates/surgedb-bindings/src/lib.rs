@@ -21,8 +21,12 @@
 //! └─────────────────────────┘
 //! ```
 
-use parking_lot::RwLock;
-use std::sync::Arc;
+use parking_lot::{Mutex, RwLock};
+use std::future::Future;
+use std::panic::{self, AssertUnwindSafe};
+use std::pin::Pin;
+use std::sync::{mpsc, Arc, OnceLock};
+use std::task::{Context, Poll, Waker};
 
 // Import the generated UniFFI scaffolding
 uniffi::include_scaffolding!("surgedb");
@@ -86,6 +90,9 @@ pub enum SurgeError {
 
     #[error("Operation cancelled")]
     Cancelled,
+
+    #[error("Internal error: {message}")]
+    Internal { message: String },
 }
 
 impl SurgeError {
@@ -110,6 +117,7 @@ impl SurgeError {
             SurgeError::SerializationError { .. } => 1500,
             SurgeError::LockFailed { .. } => 1600,
             SurgeError::Cancelled => 1601,
+            SurgeError::Internal { .. } => 1700,
         }
     }
 
@@ -229,6 +237,8 @@ impl From<DistanceMetric> for surgedb_core::DistanceMetric {
 pub enum Quantization {
     None,
     SQ8,
+    U8Vnni,
+    SQFP16,
     Binary,
 }
 
@@ -237,11 +247,30 @@ impl From<Quantization> for surgedb_core::QuantizationType {
         match val {
             Quantization::None => surgedb_core::QuantizationType::None,
             Quantization::SQ8 => surgedb_core::QuantizationType::SQ8,
+            Quantization::U8Vnni => surgedb_core::QuantizationType::U8,
+            Quantization::SQFP16 => surgedb_core::QuantizationType::F16,
             Quantization::Binary => surgedb_core::QuantizationType::Binary,
         }
     }
 }
 
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum FilterStrategy {
+    Auto,
+    Pre,
+    Post,
+}
+
+impl From<FilterStrategy> for surgedb_core::filter::FilterStrategy {
+    fn from(val: FilterStrategy) -> Self {
+        match val {
+            FilterStrategy::Auto => surgedb_core::filter::FilterStrategy::Auto,
+            FilterStrategy::Pre => surgedb_core::filter::FilterStrategy::Pre,
+            FilterStrategy::Post => surgedb_core::filter::FilterStrategy::Post,
+        }
+    }
+}
+
 // =============================================================================
 // Data Types
 // =============================================================================
@@ -253,6 +282,7 @@ pub struct SurgeConfig {
     pub quantization: Quantization,
     pub persistent: bool,
     pub data_path: Option<String>,
+    pub ef_search: Option<u32>,
 }
 
 impl Default for SurgeConfig {
@@ -263,6 +293,7 @@ impl Default for SurgeConfig {
             quantization: Quantization::None,
             persistent: false,
             data_path: None,
+            ef_search: None,
         }
     }
 }
@@ -395,11 +426,22 @@ impl SurgeClient {
 
     /// Open a database with the given configuration
     pub fn open(path: String, config: SurgeConfig) -> Result<Self, SurgeError> {
+        let mut hnsw = surgedb_core::HnswConfig::default();
+        if let Some(ef_search) = config.ef_search {
+            if ef_search == 0 {
+                return Err(SurgeError::InvalidConfig {
+                    message: "ef_search must be greater than 0".to_string(),
+                });
+            }
+            hnsw.ef_search = ef_search as usize;
+        }
+
         let inner = if config.persistent {
             // Persistent database
             let core_config = surgedb_core::PersistentConfig {
                 dimensions: config.dimensions as usize,
                 distance_metric: config.distance_metric.into(),
+                hnsw,
                 ..Default::default()
             };
             let db = surgedb_core::PersistentVectorDb::open(&path, core_config)?;
@@ -410,6 +452,7 @@ impl SurgeClient {
                 dimensions: config.dimensions as usize,
                 distance_metric: config.distance_metric.into(),
                 quantization: config.quantization.into(),
+                hnsw,
                 ..Default::default()
             };
             let db = surgedb_core::QuantizedVectorDb::new(core_config)?;
@@ -419,6 +462,7 @@ impl SurgeClient {
             let core_config = surgedb_core::Config {
                 dimensions: config.dimensions as usize,
                 distance_metric: config.distance_metric.into(),
+                hnsw,
                 ..Default::default()
             };
             let db = surgedb_core::VectorDb::new(core_config)?;
@@ -450,6 +494,16 @@ impl SurgeClient {
         Ok(())
     }
 
+    /// Insert a vector under an integer ID
+    pub fn insert_u64(
+        &self,
+        id: u64,
+        vector: Vec<f32>,
+        metadata_json: Option<String>,
+    ) -> Result<(), SurgeError> {
+        self.insert(id.to_string(), vector, metadata_json)
+    }
+
     /// Insert or update a vector
     pub fn upsert(
         &self,
@@ -482,8 +536,70 @@ impl SurgeClient {
                 Ok((surgedb_core::VectorId::from(e.id), e.vector, metadata))
             })
             .collect();
-        let items = items?;
+        self.upsert_items(items?)
+    }
+
+    /// Batch insert/upsert from one flat buffer of little-endian f32 vectors
+    ///
+    /// `flat_vectors` holds `ids.len() * dimensions` floats back to back, so the
+    /// whole batch crosses the FFI boundary as a single byte string.
+    pub fn upsert_batch_flat(
+        &self,
+        ids: Vec<String>,
+        flat_vectors: Vec<u8>,
+        metadata_json: Vec<Option<String>>,
+    ) -> Result<(), SurgeError> {
+        self.upsert_flat(ids, flat_vectors, metadata_json)
+    }
 
+    /// Batch insert/upsert from one flat buffer under integer IDs
+    pub fn upsert_batch_flat_u64(
+        &self,
+        ids: Vec<u64>,
+        flat_vectors: Vec<u8>,
+        metadata_json: Vec<Option<String>>,
+    ) -> Result<(), SurgeError> {
+        self.upsert_flat(ids, flat_vectors, metadata_json)
+    }
+
+    fn upsert_flat<I: Into<surgedb_core::VectorId>>(
+        &self,
+        ids: Vec<I>,
+        flat_vectors: Vec<u8>,
+        metadata_json: Vec<Option<String>>,
+    ) -> Result<(), SurgeError> {
+        if metadata_json.len() != ids.len() {
+            return Err(SurgeError::InvalidConfig {
+                message: format!(
+                    "expected {} metadata entries, got {}",
+                    ids.len(),
+                    metadata_json.len()
+                ),
+            });
+        }
+
+        let dimensions = self.dimensions();
+        let stride = dimensions * std::mem::size_of::<f32>();
+        if flat_vectors.len() != ids.len() * stride {
+            return Err(SurgeError::DimensionMismatch {
+                expected: dimensions as u32,
+                got: (flat_vectors.len() / std::mem::size_of::<f32>() / ids.len().max(1)) as u32,
+            });
+        }
+
+        let items: Result<BatchItems, SurgeError> = ids
+            .into_iter()
+            .zip(flat_vectors.chunks_exact(stride))
+            .zip(&metadata_json)
+            .map(|((id, bytes), metadata)| {
+                Ok((id.into(), decode_f32_le(bytes), parse_metadata(metadata)?))
+            })
+            .collect();
+
+        self.upsert_items(items?)
+    }
+
+    fn upsert_items(&self, items: BatchItems) -> Result<(), SurgeError> {
         let mut inner = self.inner.write();
 
         match &mut *inner {
@@ -537,22 +653,37 @@ impl SurgeClient {
 
     /// Search for k nearest neighbors
     pub fn search(&self, query: Vec<f32>, k: u32) -> Result<Vec<SearchResult>, SurgeError> {
-        let inner = self.inner.read();
+        search_db(&self.inner.read(), &query, k)
+    }
 
-        let results = match &*inner {
-            DbInner::InMemory(db) => db.search(&query, k as usize, None)?,
-            DbInner::Quantized(db) => db.search(&query, k as usize, None)?,
-            DbInner::Persistent(db) => db.search(&query, k as usize, None)?,
-        };
+    /// Search with the query as a little-endian f32 byte buffer
+    ///
+    /// Avoids building a Python float list per query, e.g.
+    /// `np.asarray(vector, dtype="<f4").tobytes()`.
+    pub fn search_buf(&self, query: Vec<u8>, k: u32) -> Result<Vec<SearchResult>, SurgeError> {
+        let dimensions = self.dimensions();
+        if query.len() != dimensions * std::mem::size_of::<f32>() {
+            return Err(SurgeError::DimensionMismatch {
+                expected: dimensions as u32,
+                got: (query.len() / std::mem::size_of::<f32>()) as u32,
+            });
+        }
 
-        Ok(results
-            .into_iter()
-            .map(|(id, score, metadata)| SearchResult {
-                id: id.to_string(),
-                score,
-                metadata_json: metadata.map(|m| m.to_string()),
-            })
-            .collect())
+        search_db(&self.inner.read(), &decode_f32_le(&query), k)
+    }
+
+    /// Search for k nearest neighbors without blocking the caller
+    ///
+    /// The search runs on a fixed pool of worker threads; the returned future
+    /// resolves when it finishes, so an event loop can keep many searches in
+    /// flight without a thread per call.
+    pub async fn search_async(
+        &self,
+        query: Vec<f32>,
+        k: u32,
+    ) -> Result<Vec<SearchResult>, SurgeError> {
+        let inner = Arc::clone(&self.inner);
+        BlockingTask::spawn(move || search_db(&inner.read(), &query, k)).await
     }
 
     /// Search with metadata filter
@@ -561,14 +692,22 @@ impl SurgeClient {
         query: Vec<f32>,
         k: u32,
         filter: SearchFilter,
+        strategy: Option<FilterStrategy>,
     ) -> Result<Vec<SearchResult>, SurgeError> {
         let core_filter = filter.to_core_filter()?;
+        let strategy = strategy.map(Into::into).unwrap_or_default();
         let inner = self.inner.read();
 
         let results = match &*inner {
-            DbInner::InMemory(db) => db.search(&query, k as usize, Some(&core_filter))?,
-            DbInner::Quantized(db) => db.search(&query, k as usize, Some(&core_filter))?,
-            DbInner::Persistent(db) => db.search(&query, k as usize, Some(&core_filter))?,
+            DbInner::InMemory(db) => {
+                db.search_with_strategy(&query, k as usize, Some(&core_filter), strategy)?
+            }
+            DbInner::Quantized(db) => {
+                db.search_with_strategy(&query, k as usize, Some(&core_filter), strategy)?
+            }
+            DbInner::Persistent(db) => {
+                db.search_with_strategy(&query, k as usize, Some(&core_filter), strategy)?
+            }
         };
 
         Ok(results
@@ -616,6 +755,16 @@ impl SurgeClient {
         }
     }
 
+    fn dimensions(&self) -> usize {
+        let inner = self.inner.read();
+
+        match &*inner {
+            DbInner::InMemory(db) => db.config().dimensions,
+            DbInner::Quantized(db) => db.config().dimensions,
+            DbInner::Persistent(db) => db.config().dimensions,
+        }
+    }
+
     /// Get database statistics
     pub fn stats(&self) -> DatabaseStats {
         let inner = self.inner.read();
@@ -665,10 +814,160 @@ impl SurgeClient {
     }
 }
 
+// =============================================================================
+// Async Support
+// =============================================================================
+
+/// Work item run by the shared worker pool.
+type Job = Box<dyn FnOnce() + Send + 'static>;
+
+/// Fixed set of worker threads shared by every async call.
+///
+/// Sized to the available parallelism, so any number of in-flight searches
+/// queue on the channel instead of each getting a thread.
+struct WorkerPool {
+    jobs: Mutex<mpsc::Sender<Job>>,
+}
+
+/// The process-wide pool, or `None` if no worker thread could be spawned.
+fn worker_pool() -> Option<&'static WorkerPool> {
+    static POOL: OnceLock<Option<WorkerPool>> = OnceLock::new();
+
+    POOL.get_or_init(|| {
+        let (sender, receiver) = mpsc::channel::<Job>();
+        let receiver = Arc::new(Mutex::new(receiver));
+        let threads = std::thread::available_parallelism().map_or(1, |n| n.get());
+
+        let spawned = (0..threads)
+            .filter(|i| {
+                let receiver = Arc::clone(&receiver);
+                std::thread::Builder::new()
+                    .name(format!("surgedb-worker-{i}"))
+                    .spawn(move || loop {
+                        let job = receiver.lock().recv();
+                        match job {
+                            // BlockingTask catches its own panics; this only keeps
+                            // the worker alive if waking the caller panics
+                            Ok(job) => drop(panic::catch_unwind(AssertUnwindSafe(job))),
+                            Err(_) => break,
+                        }
+                    })
+                    .is_ok()
+            })
+            .count();
+
+        (spawned > 0).then(|| WorkerPool {
+            jobs: Mutex::new(sender),
+        })
+    })
+    .as_ref()
+}
+
+/// Future for a closure running on the shared worker pool.
+///
+/// UniFFI polls async methods from the foreign language's event loop, so the
+/// blocking search must not run inside `poll`. A panic in the closure resolves
+/// the future to `SurgeError::Internal` instead of leaving it pending.
+struct BlockingTask<T> {
+    state: Arc<Mutex<TaskState<T>>>,
+}
+
+struct TaskState<T> {
+    output: Option<Result<T, SurgeError>>,
+    waker: Option<Waker>,
+}
+
+impl<T: Send + 'static> BlockingTask<T> {
+    fn spawn(f: impl FnOnce() -> Result<T, SurgeError> + Send + 'static) -> Self {
+        let state = Arc::new(Mutex::new(TaskState {
+            output: None,
+            waker: None,
+        }));
+        let worker_state = Arc::clone(&state);
+
+        let job: Job = Box::new(move || {
+            let output = panic::catch_unwind(AssertUnwindSafe(f)).unwrap_or_else(|payload| {
+                Err(SurgeError::Internal {
+                    message: panic_message(payload.as_ref()),
+                })
+            });
+            let waker = {
+                let mut state = worker_state.lock();
+                state.output = Some(output);
+                state.waker.take()
+            };
+            if let Some(waker) = waker {
+                waker.wake();
+            }
+        });
+
+        // Without a pool, run on the caller rather than panic across the FFI
+        match worker_pool() {
+            Some(pool) => {
+                if let Err(mpsc::SendError(job)) = pool.jobs.lock().send(job) {
+                    job();
+                }
+            }
+            None => job(),
+        }
+
+        Self { state }
+    }
+}
+
+impl<T> Future for BlockingTask<T> {
+    type Output = Result<T, SurgeError>;
+
+    fn poll(self: Pin<&mut Self>, cx: &mut Context<'_>) -> Poll<Self::Output> {
+        let mut state = self.state.lock();
+        match state.output.take() {
+            Some(output) => Poll::Ready(output),
+            None => {
+                state.waker = Some(cx.waker().clone());
+                Poll::Pending
+            }
+        }
+    }
+}
+
 // =============================================================================
 // Helper Functions
 // =============================================================================
 
+fn search_db(inner: &DbInner, query: &[f32], k: u32) -> Result<Vec<SearchResult>, SurgeError> {
+    let results = match inner {
+        DbInner::InMemory(db) => db.search(query, k as usize, None)?,
+        DbInner::Quantized(db) => db.search(query, k as usize, None)?,
+        DbInner::Persistent(db) => db.search(query, k as usize, None)?,
+    };
+
+    Ok(results
+        .into_iter()
+        .map(|(id, score, metadata)| SearchResult {
+            id: id.to_string(),
+            score,
+            metadata_json: metadata.map(|m| m.to_string()),
+        })
+        .collect())
+}
+
+/// Text of a caught panic payload (`panic!` yields `&str` or `String`)
+fn panic_message(payload: &(dyn std::any::Any + Send)) -> String {
+    payload
+        .downcast_ref::<&str>()
+        .map(|s| s.to_string())
+        .or_else(|| payload.downcast_ref::<String>().cloned())
+        .unwrap_or_else(|| "worker panicked".to_string())
+}
+
+/// Decode packed little-endian f32s (trailing partial bytes are ignored)
+fn decode_f32_le(bytes: &[u8]) -> Vec<f32> {
+    bytes
+        .chunks_exact(4)
+        .map(|b| f32::from_le_bytes([b[0], b[1], b[2], b[3]]))
+        .collect()
+}
+
 fn parse_metadata(json: &Option<String>) -> Result<Option<serde_json::Value>, SurgeError> {
     match json {
         Some(s) => {
@@ -694,10 +993,11 @@ pub fn version() -> String {
 /// Get system info for debugging
 pub fn system_info() -> String {
     format!(
-        "SurgeDB Bindings v{}\nTarget: {}-{}\nFeatures: SIMD-optimized",
+        "SurgeDB Bindings v{}\nTarget: {}-{}\nFeatures: SIMD-optimized\ncpu_kernel: {}",
         env!("CARGO_PKG_VERSION"),
         std::env::consts::ARCH,
         std::env::consts::OS,
+        surgedb_core::quantization::dot_u8_kernel_name(),
     )
 }
 
@@ -743,6 +1043,178 @@ mod tests {
         assert!(results[0].metadata_json.is_some());
     }
 
+    #[test]
+    fn test_search_with_filter_strategy() {
+        let client = SurgeClient::new_in_memory(4).unwrap();
+
+        client
+            .insert(
+                "vec1".to_string(),
+                vec![1.0, 0.0, 0.0, 0.0],
+                Some(r#"{"category": "a"}"#.to_string()),
+            )
+            .unwrap();
+        client
+            .insert(
+                "vec2".to_string(),
+                vec![0.9, 0.1, 0.0, 0.0],
+                Some(r#"{"category": "b"}"#.to_string()),
+            )
+            .unwrap();
+
+        let filter = SearchFilter::Exact {
+            field: "category".to_string(),
+            value_json: r#""b""#.to_string(),
+        };
+        for strategy in [None, Some(FilterStrategy::Pre), Some(FilterStrategy::Post)] {
+            let results = client
+                .search_with_filter(vec![1.0, 0.0, 0.0, 0.0], 2, filter.clone(), strategy)
+                .unwrap();
+            assert_eq!(results.len(), 1);
+            assert_eq!(results[0].id, "vec2");
+        }
+    }
+
+    #[test]
+    fn test_upsert_batch_flat() {
+        let client = SurgeClient::new_in_memory(4).unwrap();
+
+        let vectors: [[f32; 4]; 2] = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]];
+        let flat: Vec<u8> = vectors
+            .iter()
+            .flatten()
+            .flat_map(|x| x.to_le_bytes())
+            .collect();
+
+        client
+            .upsert_batch_flat(
+                vec!["vec1".to_string(), "vec2".to_string()],
+                flat.clone(),
+                vec![Some(r#"{"n": 1}"#.to_string()), None],
+            )
+            .unwrap();
+
+        assert_eq!(client.len(), 2);
+        let entry = client.get("vec2".to_string()).unwrap().unwrap();
+        assert_eq!(entry.vector, vectors[1].to_vec());
+
+        // Buffer length must match ids.len() * dimensions floats
+        assert!(matches!(
+            client.upsert_batch_flat(vec!["vec3".to_string()], flat, vec![None]),
+            Err(SurgeError::DimensionMismatch { .. })
+        ));
+    }
+
+    #[test]
+    fn test_insert_u64() {
+        let client = SurgeClient::new_in_memory(4).unwrap();
+
+        client
+            .insert_u64(42, vec![1.0, 0.0, 0.0, 0.0], None)
+            .unwrap();
+
+        let results = client.search(vec![1.0, 0.0, 0.0, 0.0], 1).unwrap();
+        assert_eq!(results[0].id, "42");
+        assert!(client.get("42".to_string()).unwrap().is_some());
+
+        let flat: Vec<u8> = [0.0f32, 1.0, 0.0, 0.0]
+            .iter()
+            .flat_map(|x| x.to_le_bytes())
+            .collect();
+        client
+            .upsert_batch_flat_u64(vec![7], flat, vec![None])
+            .unwrap();
+        assert!(client.get("7".to_string()).unwrap().is_some());
+    }
+
+    fn block_on<F: Future>(future: F) -> F::Output {
+        struct ThreadWaker(std::thread::Thread);
+
+        impl std::task::Wake for ThreadWaker {
+            fn wake(self: Arc<Self>) {
+                self.0.unpark();
+            }
+        }
+
+        let waker = Arc::new(ThreadWaker(std::thread::current())).into();
+        let mut cx = Context::from_waker(&waker);
+        let mut future = std::pin::pin!(future);
+        loop {
+            match future.as_mut().poll(&mut cx) {
+                Poll::Ready(output) => return output,
+                Poll::Pending => std::thread::park(),
+            }
+        }
+    }
+
+    #[test]
+    fn test_search_async() {
+        let client = SurgeClient::new_in_memory(4).unwrap();
+
+        client
+            .insert("vec1".to_string(), vec![1.0, 0.0, 0.0, 0.0], None)
+            .unwrap();
+        client
+            .insert("vec2".to_string(), vec![0.0, 1.0, 0.0, 0.0], None)
+            .unwrap();
+
+        let results = block_on(client.search_async(vec![1.0, 0.0, 0.0, 0.0], 2)).unwrap();
+        assert_eq!(results.len(), 2);
+        assert_eq!(results[0].id, "vec1");
+
+        // More futures than pool workers all resolve
+        let futures: Vec<_> = (0..64)
+            .map(|_| client.search_async(vec![0.0, 1.0, 0.0, 0.0], 1))
+            .collect();
+        for future in futures {
+            assert_eq!(block_on(future).unwrap()[0].id, "vec2");
+        }
+    }
+
+    #[test]
+    fn test_blocking_task_panic_resolves_to_error() {
+        let task = BlockingTask::<()>::spawn(|| panic!("search blew up"));
+
+        match block_on(task) {
+            Err(SurgeError::Internal { message }) => assert_eq!(message, "search blew up"),
+            other => panic!("expected an internal error, got {other:?}"),
+        }
+
+        // The worker that caught the panic keeps serving jobs
+        assert_eq!(block_on(BlockingTask::spawn(|| Ok(7))).unwrap(), 7);
+    }
+
+    #[test]
+    fn test_search_buf() {
+        let client = SurgeClient::new_in_memory(4).unwrap();
+
+        client
+            .insert("vec1".to_string(), vec![1.0, 0.0, 0.0, 0.0], None)
+            .unwrap();
+        client
+            .insert("vec2".to_string(), vec![0.0, 1.0, 0.0, 0.0], None)
+            .unwrap();
+
+        let query: Vec<u8> = [0.0f32, 1.0, 0.0, 0.0]
+            .iter()
+            .flat_map(|x| x.to_le_bytes())
+            .collect();
+        let results = client.search_buf(query, 1).unwrap();
+        assert_eq!(results[0].id, "vec2");
+
+        assert!(matches!(
+            client.search_buf(vec![0; 12], 1),
+            Err(SurgeError::DimensionMismatch { .. })
+        ));
+    }
+
+    #[test]
+    fn test_system_info_reports_kernel() {
+        let info = system_info();
+        let kernel = surgedb_core::quantization::dot_u8_kernel_name();
+        assert!(info.contains(&format!("cpu_kernel: {}", kernel)));
+    }
+
     #[test]
     fn test_delete() {
         let client = SurgeClient::new_in_memory(4).unwrap();
@@ -770,4 +1242,67 @@ mod tests {
         assert_eq!(stats.dimensions, 128);
         assert!(stats.memory_usage_bytes > 0);
     }
+
+    #[test]
+    fn test_u8_vnni_quantization() {
+        let config = SurgeConfig {
+            dimensions: 4,
+            quantization: Quantization::U8Vnni,
+            ..Default::default()
+        };
+        let client = SurgeClient::open(String::new(), config).unwrap();
+
+        client
+            .insert("vec1".to_string(), vec![1.0, 0.0, 0.0, 0.0], None)
+            .unwrap();
+        client
+            .insert("vec2".to_string(), vec![0.0, 1.0, 0.0, 0.0], None)
+            .unwrap();
+
+        let results = client.search(vec![1.0, 0.0, 0.0, 0.0], 1).unwrap();
+        assert_eq!(results[0].id, "vec1");
+    }
+
+    #[test]
+    fn test_ef_search_config() {
+        let config = SurgeConfig {
+            dimensions: 4,
+            ef_search: Some(0),
+            ..Default::default()
+        };
+        assert!(matches!(
+            SurgeClient::open(String::new(), config),
+            Err(SurgeError::InvalidConfig { .. })
+        ));
+
+        let config = SurgeConfig {
+            dimensions: 4,
+            ef_search: Some(16),
+            ..Default::default()
+        };
+        let client = SurgeClient::open(String::new(), config).unwrap();
+        client
+            .insert("vec1".to_string(), vec![1.0, 0.0, 0.0, 0.0], None)
+            .unwrap();
+        assert_eq!(client.search(vec![1.0, 0.0, 0.0, 0.0], 1).unwrap().len(), 1);
+    }
+
+    #[test]
+    fn test_sqfp16_quantization() {
+        let config = SurgeConfig {
+            dimensions: 8,
+            quantization: Quantization::SQFP16,
+            ..Default::default()
+        };
+        let client = SurgeClient::open(String::new(), config).unwrap();
+
+        for i in 0..10 {
+            let vector: Vec<f32> = (0..8).map(|j| ((i * 8 + j) as f32).sin()).collect();
+            client.insert(format!("v{}", i), vector, None).unwrap();
+        }
+
+        let query: Vec<f32> = (0..8).map(|j| ((24 + j) as f32).sin()).collect();
+        let results = client.search(query, 1).unwrap();
+        assert_eq!(results[0].id, "v3");
+    }
 }
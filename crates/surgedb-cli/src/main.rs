@@ -166,6 +166,8 @@ enum Commands {
 enum QuantizationArg {
     None,
     Sq8,
+    U8,
+    F16,
     Binary,
 }
 
@@ -328,6 +330,8 @@ fn run_benchmark(count: usize, dimensions: usize, quantization: QuantizationArg)
     let quant_name = match quantization {
         QuantizationArg::None => "None (f32)",
         QuantizationArg::Sq8 => "SQ8 (u8)",
+        QuantizationArg::U8 => "U8 (u8 x u8)",
+        QuantizationArg::F16 => "F16 (half)",
         QuantizationArg::Binary => "Binary (1-bit)",
     };
 
@@ -354,6 +358,8 @@ fn run_benchmark(count: usize, dimensions: usize, quantization: QuantizationArg)
     match quantization {
         QuantizationArg::None => run_unquantized_bench(&vectors, dimensions),
         QuantizationArg::Sq8 => run_quantized_bench(&vectors, dimensions, QuantizationType::SQ8),
+        QuantizationArg::U8 => run_quantized_bench(&vectors, dimensions, QuantizationType::U8),
+        QuantizationArg::F16 => run_quantized_bench(&vectors, dimensions, QuantizationType::F16),
         QuantizationArg::Binary => {
             run_quantized_bench(&vectors, dimensions, QuantizationType::Binary)
         }
@@ -804,6 +810,8 @@ fn run_comparison(count: usize, dimensions: usize) {
     let modes = [
         ("None (f32)", QuantizationType::None),
         ("SQ8 (u8)", QuantizationType::SQ8),
+        ("U8 (u8 x u8)", QuantizationType::U8),
+        ("F16 (half)", QuantizationType::F16),
         ("Binary", QuantizationType::Binary),
     ];
 
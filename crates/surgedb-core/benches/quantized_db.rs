@@ -3,8 +3,8 @@
 use criterion::{black_box, criterion_group, criterion_main, BatchSize, BenchmarkId, Criterion};
 use rand::{rngs::StdRng, Rng, SeedableRng};
 use serde_json::{json, Value};
-use surgedb_core::{QuantizationType, QuantizedConfig, QuantizedVectorDb, DistanceMetric};
 use surgedb_core::types::VectorId;
+use surgedb_core::{DistanceMetric, QuantizationType, QuantizedConfig, QuantizedVectorDb};
 
 fn bench_sizes() -> Vec<usize> {
     let mut sizes = vec![2_000, 10_000];
@@ -32,7 +32,12 @@ fn generate_vectors(
         .collect()
 }
 
-fn build_db(dim: usize, count: usize, seed: u64, quantization: QuantizationType) -> QuantizedVectorDb {
+fn build_db(
+    dim: usize,
+    count: usize,
+    seed: u64,
+    quantization: QuantizationType,
+) -> QuantizedVectorDb {
     let config = QuantizedConfig {
         dimensions: dim,
         distance_metric: DistanceMetric::Cosine,
@@ -50,19 +55,29 @@ fn bench_upsert_batch(c: &mut Criterion) {
 
     for dim in [128_usize, 384].iter() {
         for size in bench_sizes() {
-            for quant in [QuantizationType::SQ8, QuantizationType::Binary].iter() {
+            for quant in [
+                QuantizationType::SQ8,
+                QuantizationType::U8,
+                QuantizationType::F16,
+                QuantizationType::Binary,
+            ]
+            .iter()
+            {
                 let items = generate_vectors(size, *dim, 42);
                 group.bench_with_input(
                     BenchmarkId::new(format!("dim{dim}_{quant:?}"), size),
                     &size,
                     |b, _| {
                         b.iter_batched(
-                            || QuantizedVectorDb::new(QuantizedConfig {
-                                dimensions: *dim,
-                                distance_metric: DistanceMetric::Cosine,
-                                quantization: *quant,
-                                ..Default::default()
-                            }).expect("create quantized db"),
+                            || {
+                                QuantizedVectorDb::new(QuantizedConfig {
+                                    dimensions: *dim,
+                                    distance_metric: DistanceMetric::Cosine,
+                                    quantization: *quant,
+                                    ..Default::default()
+                                })
+                                .expect("create quantized db")
+                            },
                             |mut db| {
                                 db.upsert_batch(items.clone()).expect("upsert batch");
                                 black_box(db.len());
@@ -83,7 +98,14 @@ fn bench_search(c: &mut Criterion) {
 
     for dim in [128_usize, 384].iter() {
         for size in bench_sizes() {
-            for quant in [QuantizationType::SQ8, QuantizationType::Binary].iter() {
+            for quant in [
+                QuantizationType::SQ8,
+                QuantizationType::U8,
+                QuantizationType::F16,
+                QuantizationType::Binary,
+            ]
+            .iter()
+            {
                 let db = build_db(*dim, size, 99, *quant);
                 let mut rng = StdRng::seed_from_u64(123);
                 let query: Vec<f32> = (0..*dim).map(|_| rng.gen::<f32>()).collect();
@@ -93,9 +115,7 @@ fn bench_search(c: &mut Criterion) {
                     &size,
                     |b, _| {
                         b.iter(|| {
-                            let results = db
-                                .search(black_box(&query), 10, None)
-                                .expect("search");
+                            let results = db.search(black_box(&query), 10, None).expect("search");
                             black_box(results.len());
                         });
                     },
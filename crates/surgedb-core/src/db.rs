@@ -1,3 +1,4 @@
+use crate::filter::FilterStrategy;
 use crate::sync::RwLock;
 use crate::types::VectorId;
 use crate::{
@@ -106,12 +107,24 @@ impl Collection {
         query: &[f32],
         k: usize,
         filter: Option<&crate::filter::Filter>,
+    ) -> Result<Vec<(VectorId, f32, Option<Value>)>> {
+        self.search_with_strategy(query, k, filter, FilterStrategy::Auto)
+    }
+
+    pub fn search_with_strategy(
+        &self,
+        query: &[f32],
+        k: usize,
+        filter: Option<&crate::filter::Filter>,
+        strategy: FilterStrategy,
     ) -> Result<Vec<(VectorId, f32, Option<Value>)>> {
         match self {
-            Collection::Standard(db) => db.read().search(query, k, filter),
-            Collection::Quantized(db) => db.read().search(query, k, filter),
+            Collection::Standard(db) => db.read().search_with_strategy(query, k, filter, strategy),
+            Collection::Quantized(db) => db.read().search_with_strategy(query, k, filter, strategy),
             #[cfg(feature = "persistence")]
-            Collection::Persistent(db) => db.read().search(query, k, filter),
+            Collection::Persistent(db) => {
+                db.read().search_with_strategy(query, k, filter, strategy)
+            }
         }
     }
 
@@ -120,12 +133,28 @@ impl Collection {
         query: &[f32],
         k: usize,
         filter: Option<&crate::filter::Filter>,
+    ) -> Result<Vec<(VectorId, f32)>> {
+        self.search_ids_with_strategy(query, k, filter, FilterStrategy::Auto)
+    }
+
+    pub fn search_ids_with_strategy(
+        &self,
+        query: &[f32],
+        k: usize,
+        filter: Option<&crate::filter::Filter>,
+        strategy: FilterStrategy,
     ) -> Result<Vec<(VectorId, f32)>> {
         match self {
-            Collection::Standard(db) => db.read().search_ids(query, k, filter),
-            Collection::Quantized(db) => db.read().search_ids(query, k, filter),
+            Collection::Standard(db) => db
+                .read()
+                .search_ids_with_strategy(query, k, filter, strategy),
+            Collection::Quantized(db) => db
+                .read()
+                .search_ids_with_strategy(query, k, filter, strategy),
             #[cfg(feature = "persistence")]
-            Collection::Persistent(db) => db.read().search_ids(query, k, filter),
+            Collection::Persistent(db) => db
+                .read()
+                .search_ids_with_strategy(query, k, filter, strategy),
         }
     }
 
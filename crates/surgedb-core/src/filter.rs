@@ -31,6 +31,23 @@ pub enum Filter {
     },
 }
 
+/// Fraction of the collection below which `FilterStrategy::Auto` pre-filters
+pub const PRE_FILTER_SELECTIVITY: f64 = 0.1;
+
+/// How a filtered search combines the filter with the HNSW graph walk
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Default, Serialize, Deserialize)]
+pub enum FilterStrategy {
+    /// Pre-filter when the filter matches less than `PRE_FILTER_SELECTIVITY`
+    /// of the collection (per the bitmap index), otherwise post-filter
+    #[default]
+    Auto,
+    /// Exact scan over only the matching vectors; excluded vectors never
+    /// have their distance computed
+    Pre,
+    /// HNSW traversal with the filter applied inside the search loop
+    Post,
+}
+
 impl Filter {
     /// Check if the metadata matches the filter
     pub fn matches(&self, metadata: &Value) -> bool {
@@ -8,7 +8,7 @@
 
 use crate::distance::DistanceMetric;
 use crate::error::{Error, Result};
-use crate::filter::Filter;
+use crate::filter::{Filter, FilterStrategy, PRE_FILTER_SELECTIVITY};
 use crate::storage::VectorStorageTrait;
 use crate::sync::RwLock;
 use crate::types::InternalId;
@@ -21,6 +21,10 @@ use std::cmp::Ordering;
 use std::collections::{BinaryHeap, HashSet};
 use std::sync::OnceLock;
 
+/// Vector bytes per `insert_batch` tile, sized to a typical per-core L2 cache
+#[cfg(feature = "parallel")]
+const INSERT_TILE_BYTES: usize = 256 * 1024;
+
 fn bitmap_filter_enabled() -> bool {
     static ENABLED: OnceLock<bool> = OnceLock::new();
     *ENABLED.get_or_init(|| std::env::var("SURGEDB_DISABLE_BITMAP_FILTER").is_err())
@@ -167,6 +171,35 @@ impl Ord for MaxCandidate {
     }
 }
 
+/// Select the `k` nearest candidates, sorted by ascending distance.
+///
+/// Keeps a bounded max-heap of size `k`, so selecting from `n` candidates
+/// costs O(n log k) instead of the O(n log n) of a full sort.
+pub(crate) fn top_k<I>(candidates: I, k: usize) -> Vec<(InternalId, f32)>
+where
+    I: IntoIterator<Item = (InternalId, f32)>,
+{
+    if k == 0 {
+        return Vec::new();
+    }
+
+    let mut heap: BinaryHeap<MaxCandidate> = BinaryHeap::with_capacity(k);
+    for (id, distance) in candidates {
+        if heap.len() < k {
+            heap.push(MaxCandidate { id, distance });
+        } else if let Some(mut furthest) = heap.peek_mut() {
+            if distance < furthest.distance {
+                *furthest = MaxCandidate { id, distance };
+            }
+        }
+    }
+
+    heap.into_sorted_vec()
+        .into_iter()
+        .map(|c| (c.id, c.distance))
+        .collect()
+}
+
 struct SearchContext<'a> {
     query: &'a [f32],
     ef: usize,
@@ -236,11 +269,43 @@ impl HnswIndex {
     }
 
     /// Insert multiple vectors in a batch
+    ///
+    /// The batch is processed in tiles of about `INSERT_TILE_BYTES` of vector
+    /// data. Each tile searches the graph in parallel and then links its nodes,
+    /// so later tiles see (and connect to) earlier ones, and the vectors and
+    /// neighbor lists a tile touches stay cache-resident.
     #[cfg(feature = "parallel")]
     pub fn insert_batch(
         &self,
         items: &[(InternalId, &[f32])],
         storage: &(impl VectorStorageTrait + Sync),
+    ) -> Result<()> {
+        let Some(&(_, first)) = items.first() else {
+            return Ok(());
+        };
+
+        let tile = (INSERT_TILE_BYTES / std::mem::size_of_val(first).max(1)).max(1);
+
+        // While the graph is smaller than a tile, parallel searches would all
+        // see the same handful of nodes; build that core sequentially
+        let seed = tile.saturating_sub(self.len()).min(items.len());
+        for &(internal_id, vector) in &items[..seed] {
+            self.insert(internal_id, vector, storage)?;
+        }
+
+        for chunk in items[seed..].chunks(tile) {
+            self.insert_tile(chunk, storage)?;
+        }
+
+        Ok(())
+    }
+
+    /// Insert one tile: parallel neighbor search, then sequential linking
+    #[cfg(feature = "parallel")]
+    fn insert_tile(
+        &self,
+        items: &[(InternalId, &[f32])],
+        storage: &(impl VectorStorageTrait + Sync),
     ) -> Result<()> {
         use rayon::prelude::*; // Use inside function to avoid trait/impl conflict
 
@@ -758,6 +823,18 @@ impl HnswIndex {
         k: usize,
         storage: &impl VectorStorageTrait,
         filter: Option<&Filter>,
+    ) -> Result<Vec<(InternalId, f32)>> {
+        self.search_with_strategy(query, k, storage, filter, FilterStrategy::Auto)
+    }
+
+    /// Search for k nearest neighbors with an explicit filter strategy
+    pub fn search_with_strategy(
+        &self,
+        query: &[f32],
+        k: usize,
+        storage: &impl VectorStorageTrait,
+        filter: Option<&Filter>,
+        strategy: FilterStrategy,
     ) -> Result<Vec<(InternalId, f32)>> {
         let nodes = self.nodes.read();
         let entry_point = self.entry_point.read();
@@ -768,6 +845,41 @@ impl HnswIndex {
             None => return Err(Error::EmptyIndex),
         };
 
+        let filter_bitmap = if bitmap_filter_enabled() {
+            filter.and_then(|f| storage.filter_bitmap(f))
+        } else {
+            None
+        };
+
+        if let Some(f) = filter {
+            let pre_filter = match strategy {
+                FilterStrategy::Pre => true,
+                FilterStrategy::Post => false,
+                // The bitmap cardinality is the selectivity estimate
+                FilterStrategy::Auto => filter_bitmap.as_ref().is_some_and(|bitmap| {
+                    (bitmap.len() as f64) < PRE_FILTER_SELECTIVITY * nodes.len() as f64
+                }),
+            };
+
+            if pre_filter {
+                return Ok(match filter_bitmap {
+                    Some(bitmap) => {
+                        let matching = bitmap.iter().map(|id| InternalId::from(id as usize));
+                        self.scan(query, k, storage, matching)
+                    }
+                    None => {
+                        let matching = (0..nodes.len()).map(InternalId::from).filter(|&id| {
+                            storage
+                                .get_metadata(id)
+                                .map(|m| f.matches(&m))
+                                .unwrap_or(false)
+                        });
+                        self.scan(query, k, storage, matching)
+                    }
+                });
+            }
+        }
+
         // Traverse from top layer to layer 1
         let mut current_ep = ep;
         for layer in (1..=max_layer).rev() {
@@ -776,11 +888,6 @@ impl HnswIndex {
 
         // Search in layer 0 with ef_search
         let ef = self.config.ef_search.max(k);
-        let filter_bitmap = if bitmap_filter_enabled() {
-            filter.and_then(|f| storage.filter_bitmap(f))
-        } else {
-            None
-        };
         let ctx = SearchContext {
             query,
             ef,
@@ -798,6 +905,24 @@ impl HnswIndex {
             .collect())
     }
 
+    /// Exact top-k over a pre-filtered candidate set
+    fn scan(
+        &self,
+        query: &[f32],
+        k: usize,
+        storage: &impl VectorStorageTrait,
+        candidates: impl Iterator<Item = InternalId>,
+    ) -> Vec<(InternalId, f32)> {
+        let scored = candidates
+            .filter(|&id| !storage.is_deleted(id))
+            .filter_map(|id| {
+                storage
+                    .distance(id, query, self.distance_metric)
+                    .map(|dist| (id, dist))
+            });
+        top_k(scored, k)
+    }
+
     /// Get the number of nodes in the index
     pub fn len(&self) -> usize {
         self.nodes.read().len()
@@ -918,4 +1043,115 @@ mod tests {
         let first_id = storage.get_external_id(results[0].0).unwrap();
         assert_eq!(first_id.as_str(), "vec0");
     }
+
+    #[test]
+    fn test_insert_batch_tiles() {
+        // 1 KiB vectors -> 256 per tile: a sequential seed plus parallel tiles
+        let dims = 256;
+        let config = HnswConfig::default();
+        let index = HnswIndex::new(config, DistanceMetric::Euclidean);
+        let storage = VectorStorage::new(dims);
+
+        let vectors: Vec<Vec<f32>> = (0..700)
+            .map(|i| {
+                (0..dims)
+                    .map(|j| ((i * dims + j) as f32 * 0.618).sin())
+                    .collect()
+            })
+            .collect();
+        let items: Vec<(InternalId, &[f32])> = vectors
+            .iter()
+            .enumerate()
+            .map(|(i, v)| {
+                let id = storage.insert(format!("vec{}", i).into(), v, None).unwrap();
+                (id, v.as_slice())
+            })
+            .collect();
+
+        index.insert_batch(&items, &storage).unwrap();
+        assert_eq!(index.len(), vectors.len());
+
+        // Nodes from every tile must be reachable from the entry point
+        for &i in &[0, 300, 699] {
+            let results = index.search(&vectors[i], 1, &storage, None).unwrap();
+            assert_eq!(results[0].0, items[i].0);
+        }
+    }
+
+    #[test]
+    fn test_top_k() {
+        let distances = [0.5, 0.1, 0.9, 0.3, 0.7, 0.2];
+        let candidates = distances
+            .iter()
+            .enumerate()
+            .map(|(i, &d)| (InternalId::from(i), d));
+
+        let top = top_k(candidates.clone(), 3);
+        let ids: Vec<usize> = top.iter().map(|(id, _)| id.as_usize()).collect();
+        assert_eq!(ids, vec![1, 5, 3]);
+
+        assert_eq!(top_k(candidates.clone(), 10).len(), distances.len());
+        assert!(top_k(candidates, 0).is_empty());
+    }
+
+    #[test]
+    fn test_search_with_strategy_paths() {
+        let index = HnswIndex::new(HnswConfig::default(), DistanceMetric::Cosine);
+        let storage = create_test_storage();
+
+        // 40 points on an arc: node i at angle 0.02 * i, so distance to the
+        // query (angle 0) grows with i
+        for i in 0..40 {
+            let angle = i as f32 * 0.02;
+            let vector = [angle.cos(), angle.sin(), 0.0, 0.0];
+            let parity = if i % 2 == 0 { "even" } else { "odd" };
+            storage
+                .insert(
+                    format!("vec{}", i).into(),
+                    &vector,
+                    Some(serde_json::json!({"tag": parity, "bucket": i % 20})),
+                )
+                .unwrap();
+        }
+
+        // Hand-built layer-0 path 10 -> 11 -> ... -> 39 -> 0 -> ... -> 9,
+        // entered at 10: the nearest nodes sit behind the farthest ones, so
+        // the graph walk stops before reaching them
+        let order: Vec<usize> = (10..40).chain(0..10).collect();
+        let mut nodes: Vec<HnswNode> = (0..40)
+            .map(|i| HnswNode::new(InternalId::from(i), 0))
+            .collect();
+        for pair in order.windows(2) {
+            nodes[pair[0]].neighbors[0].push(InternalId::from(pair[1]));
+            nodes[pair[1]].neighbors[0].push(InternalId::from(pair[0]));
+        }
+        index.load_state(HnswState {
+            nodes,
+            entry_point: Some(InternalId::from(10)),
+            max_layer: 0,
+        });
+
+        let query = [1.0, 0.0, 0.0, 0.0];
+        let view = storage.view();
+        let search = |filter: &Filter, strategy| -> Vec<usize> {
+            index
+                .search_with_strategy(&query, 2, &view, Some(filter), strategy)
+                .unwrap()
+                .iter()
+                .map(|(id, _)| id.as_usize())
+                .collect()
+        };
+
+        // Selective: 2 of 40 match, below PRE_FILTER_SELECTIVITY
+        let rare = Filter::Exact("bucket".to_string(), serde_json::json!(0));
+        assert_eq!(search(&rare, FilterStrategy::Pre), vec![0, 20]);
+        assert_eq!(search(&rare, FilterStrategy::Post), vec![20]);
+        assert_eq!(search(&rare, FilterStrategy::Auto), vec![0, 20]);
+
+        // Broad: half the nodes match, so Auto stays on the graph walk
+        let broad = Filter::Exact("tag".to_string(), serde_json::json!("even"));
+        assert_eq!(search(&broad, FilterStrategy::Pre), vec![0, 2]);
+        assert_eq!(search(&broad, FilterStrategy::Post), vec![10]);
+        assert_eq!(search(&broad, FilterStrategy::Auto), vec![10]);
+    }
 }
@@ -5,7 +5,7 @@
 //! # Features
 //! - SIMD-accelerated distance calculations (NEON/AVX-512)
 //! - Adaptive HNSW indexing (In-Memory, Mmap, Hybrid)
-//! - Built-in quantization (SQ8, Binary)
+//! - Built-in quantization (SQ8, U8, F16, Binary)
 //! - ACID-compliant persistence (native only, not WASM)
 //!
 //! # Quick Start
@@ -84,7 +84,9 @@ pub mod db;
 pub use distance::DistanceMetric;
 pub use error::{Error, Result};
 pub use hnsw::{HnswConfig, HnswIndex};
-pub use quantization::{BinaryQuantizer, QuantizationType, SQ8Quantizer};
+pub use quantization::{
+    BinaryQuantizer, F16Quantizer, QuantizationType, SQ8Quantizer, U8Quantizer,
+};
 pub use quantized_storage::QuantizedStorage;
 pub use storage::{VectorStorage, VectorStorageTrait};
 pub use types::{Vector, VectorId};
@@ -306,6 +308,17 @@ impl VectorDb {
         query: &[f32],
         k: usize,
         filter: Option<&filter::Filter>,
+    ) -> Result<Vec<(VectorId, f32, Option<Value>)>> {
+        self.search_with_strategy(query, k, filter, filter::FilterStrategy::Auto)
+    }
+
+    /// Search for the k nearest neighbors using `strategy` for the filter
+    pub fn search_with_strategy(
+        &self,
+        query: &[f32],
+        k: usize,
+        filter: Option<&filter::Filter>,
+        strategy: filter::FilterStrategy,
     ) -> Result<Vec<(VectorId, f32, Option<Value>)>> {
         if query.len() != self.config.dimensions {
             return Err(Error::DimensionMismatch {
@@ -317,9 +330,13 @@ impl VectorDb {
         // We search for more candidates (2x k) to account for potential stale/deleted entries
         // that might be filtered out.
         let search_k = k * 2;
-        let results = self
-            .index
-            .search(query, search_k, &self.storage.view(), filter)?;
+        let results = self.index.search_with_strategy(
+            query,
+            search_k,
+            &self.storage.view(),
+            filter,
+            strategy,
+        )?;
 
         // Map internal IDs back to external IDs and fetch metadata
         // Filter out stale entries (where internal_id doesn't match current mapping)
@@ -349,6 +366,17 @@ impl VectorDb {
         query: &[f32],
         k: usize,
         filter: Option<&filter::Filter>,
+    ) -> Result<Vec<(VectorId, f32)>> {
+        self.search_ids_with_strategy(query, k, filter, filter::FilterStrategy::Auto)
+    }
+
+    /// Search for the k nearest neighbors (without metadata) using `strategy` for the filter
+    pub fn search_ids_with_strategy(
+        &self,
+        query: &[f32],
+        k: usize,
+        filter: Option<&filter::Filter>,
+        strategy: filter::FilterStrategy,
     ) -> Result<Vec<(VectorId, f32)>> {
         if query.len() != self.config.dimensions {
             return Err(Error::DimensionMismatch {
@@ -358,9 +386,13 @@ impl VectorDb {
         }
 
         let search_k = k * 2;
-        let results = self
-            .index
-            .search(query, search_k, &self.storage.view(), filter)?;
+        let results = self.index.search_with_strategy(
+            query,
+            search_k,
+            &self.storage.view(),
+            filter,
+            strategy,
+        )?;
 
         let mapped: Vec<(VectorId, f32)> = results
             .into_iter()
@@ -401,7 +433,7 @@ impl VectorDb {
 
 /// Quantized vector database with configurable compression
 ///
-/// Uses SQ8 (4x compression) or Binary (32x compression) quantization
+/// Uses SQ8 or U8 (4x compression), F16 (2x) or Binary (32x compression) quantization
 /// to dramatically reduce memory usage with minimal accuracy loss.
 pub struct QuantizedVectorDb {
     config: QuantizedConfig,
@@ -559,6 +591,17 @@ impl QuantizedVectorDb {
         query: &[f32],
         k: usize,
         filter: Option<&filter::Filter>,
+    ) -> Result<Vec<(VectorId, f32, Option<Value>)>> {
+        self.search_with_strategy(query, k, filter, filter::FilterStrategy::Auto)
+    }
+
+    /// Search for the k nearest neighbors using `strategy` for the filter
+    pub fn search_with_strategy(
+        &self,
+        query: &[f32],
+        k: usize,
+        filter: Option<&filter::Filter>,
+        strategy: filter::FilterStrategy,
     ) -> Result<Vec<(VectorId, f32, Option<Value>)>> {
         if query.len() != self.config.dimensions {
             return Err(Error::DimensionMismatch {
@@ -586,13 +629,19 @@ impl QuantizedVectorDb {
         // Use HNSW if available
         let results: Vec<(types::InternalId, f32)> = if let Some(index) = &self.index {
             // HNSW Search
-            index.search(query, search_k, &self.storage.view(), filter)?
+            index.search_with_strategy(
+                query,
+                search_k,
+                &self.storage.view_for_query(query),
+                filter,
+                strategy,
+            )?
         } else {
             // Fallback to Brute Force
             let storage_view = self.storage.view();
             let quantized_query = self.storage.quantize_query(query);
 
-            let mut candidates: Vec<(types::InternalId, f32)> = self
+            let candidates = self
                 .storage
                 .all_internal_ids()
                 .into_iter()
@@ -611,10 +660,8 @@ impl QuantizedVectorDb {
                     storage_view
                         .distance_quantized(query, &quantized_query, id, metric)
                         .map(|dist| (id, dist))
-                })
-                .collect();
-            candidates.sort_by(|a, b| a.1.partial_cmp(&b.1).unwrap_or(std::cmp::Ordering::Equal));
-            candidates.into_iter().take(search_k).collect()
+                });
+            hnsw::top_k(candidates, search_k)
         };
 
         // Filter stale results
@@ -637,18 +684,14 @@ impl QuantizedVectorDb {
                 let top_candidates: Vec<_> = valid_candidates.into_iter().take(k_rerank).collect();
 
                 // Re-rank using original vectors
-                let mut reranked: Vec<_> = top_candidates
-                    .into_iter()
-                    .filter_map(|(id, _)| {
-                        self.storage.get_original(id).map(|orig| {
-                            let dist = metric.distance(query, &orig);
-                            (id, dist)
-                        })
+                let reranked = top_candidates.into_iter().filter_map(|(id, _)| {
+                    self.storage.get_original(id).map(|orig| {
+                        let dist = metric.distance(query, &orig);
+                        (id, dist)
                     })
-                    .collect();
+                });
 
-                reranked.sort_by(|a, b| a.1.partial_cmp(&b.1).unwrap_or(std::cmp::Ordering::Equal));
-                reranked.into_iter().take(k).collect()
+                hnsw::top_k(reranked, k)
             } else {
                 valid_candidates.into_iter().take(k).collect()
             };
@@ -673,6 +716,17 @@ impl QuantizedVectorDb {
         query: &[f32],
         k: usize,
         filter: Option<&filter::Filter>,
+    ) -> Result<Vec<(VectorId, f32)>> {
+        self.search_ids_with_strategy(query, k, filter, filter::FilterStrategy::Auto)
+    }
+
+    /// Search for the k nearest neighbors (without metadata) using `strategy` for the filter
+    pub fn search_ids_with_strategy(
+        &self,
+        query: &[f32],
+        k: usize,
+        filter: Option<&filter::Filter>,
+        strategy: filter::FilterStrategy,
     ) -> Result<Vec<(VectorId, f32)>> {
         if query.len() != self.config.dimensions {
             return Err(Error::DimensionMismatch {
@@ -695,12 +749,18 @@ impl QuantizedVectorDb {
         let search_k = k * multiplier * 2;
 
         let results: Vec<(types::InternalId, f32)> = if let Some(index) = &self.index {
-            index.search(query, search_k, &self.storage.view(), filter)?
+            index.search_with_strategy(
+                query,
+                search_k,
+                &self.storage.view_for_query(query),
+                filter,
+                strategy,
+            )?
         } else {
             let storage_view = self.storage.view();
             let quantized_query = self.storage.quantize_query(query);
 
-            let mut candidates: Vec<(types::InternalId, f32)> = self
+            let candidates = self
                 .storage
                 .all_internal_ids()
                 .into_iter()
@@ -719,10 +779,8 @@ impl QuantizedVectorDb {
                     storage_view
                         .distance_quantized(query, &quantized_query, id, metric)
                         .map(|dist| (id, dist))
-                })
-                .collect();
-            candidates.sort_by(|a, b| a.1.partial_cmp(&b.1).unwrap_or(std::cmp::Ordering::Equal));
-            candidates.into_iter().take(search_k).collect()
+                });
+            hnsw::top_k(candidates, search_k)
         };
 
         let valid_candidates: Vec<(types::InternalId, f32)> = results
@@ -742,18 +800,14 @@ impl QuantizedVectorDb {
                 let k_rerank = k * self.config.rerank_multiplier;
                 let top_candidates: Vec<_> = valid_candidates.into_iter().take(k_rerank).collect();
 
-                let mut reranked: Vec<_> = top_candidates
-                    .into_iter()
-                    .filter_map(|(id, _)| {
-                        self.storage.get_original(id).map(|orig| {
-                            let dist = metric.distance(query, &orig);
-                            (id, dist)
-                        })
+                let reranked = top_candidates.into_iter().filter_map(|(id, _)| {
+                    self.storage.get_original(id).map(|orig| {
+                        let dist = metric.distance(query, &orig);
+                        (id, dist)
                     })
-                    .collect();
+                });
 
-                reranked.sort_by(|a, b| a.1.partial_cmp(&b.1).unwrap_or(std::cmp::Ordering::Equal));
-                reranked.into_iter().take(k).collect()
+                hnsw::top_k(reranked, k)
             } else {
                 valid_candidates.into_iter().take(k).collect()
             };
@@ -861,6 +915,30 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_quantized_u8_insert_and_search() {
+        let config = QuantizedConfig {
+            dimensions: 4,
+            quantization: QuantizationType::U8,
+            ..Default::default()
+        };
+
+        let mut db = QuantizedVectorDb::new(config).unwrap();
+
+        db.insert("vec1", &[1.0, 0.0, 0.0, 0.0], None).unwrap();
+        db.insert("vec2", &[0.0, 1.0, 0.0, 0.0], None).unwrap();
+        db.insert("vec3", &[0.9, 0.1, 0.0, 0.0], None).unwrap();
+
+        let results = db.search(&[1.0, 0.0, 0.0, 0.0], 2, None).unwrap();
+
+        assert_eq!(results.len(), 2);
+        assert!(
+            results[0].0.as_str() == "vec1" || results[0].0.as_str() == "vec3",
+            "First result: {}",
+            results[0].0.as_str()
+        );
+    }
+
     #[test]
     fn test_quantized_binary_insert_and_search() {
         let config = QuantizedConfig {
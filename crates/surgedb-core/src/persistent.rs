@@ -223,6 +223,17 @@ impl PersistentVectorDb {
         query: &[f32],
         k: usize,
         filter: Option<&crate::filter::Filter>,
+    ) -> Result<Vec<(VectorId, f32, Option<Value>)>> {
+        self.search_with_strategy(query, k, filter, crate::filter::FilterStrategy::Auto)
+    }
+
+    /// Search for the k nearest neighbors using `strategy` for the filter
+    pub fn search_with_strategy(
+        &self,
+        query: &[f32],
+        k: usize,
+        filter: Option<&crate::filter::Filter>,
+        strategy: crate::filter::FilterStrategy,
     ) -> Result<Vec<(VectorId, f32, Option<Value>)>> {
         if query.len() != self.config.dimensions {
             return Err(Error::DimensionMismatch {
@@ -231,7 +242,9 @@ impl PersistentVectorDb {
             });
         }
 
-        let results = self.index.search(query, k, &self.storage, filter)?;
+        let results = self
+            .index
+            .search_with_strategy(query, k, &self.storage, filter, strategy)?;
 
         let mapped: Vec<(VectorId, f32, Option<Value>)> = results
             .into_iter()
@@ -252,6 +265,17 @@ impl PersistentVectorDb {
         query: &[f32],
         k: usize,
         filter: Option<&crate::filter::Filter>,
+    ) -> Result<Vec<(VectorId, f32)>> {
+        self.search_ids_with_strategy(query, k, filter, crate::filter::FilterStrategy::Auto)
+    }
+
+    /// Search for the k nearest neighbors (without metadata) using `strategy` for the filter
+    pub fn search_ids_with_strategy(
+        &self,
+        query: &[f32],
+        k: usize,
+        filter: Option<&crate::filter::Filter>,
+        strategy: crate::filter::FilterStrategy,
     ) -> Result<Vec<(VectorId, f32)>> {
         if query.len() != self.config.dimensions {
             return Err(Error::DimensionMismatch {
@@ -261,9 +285,13 @@ impl PersistentVectorDb {
         }
 
         let search_k = k * 2;
-        let results = self
-            .index
-            .search(query, search_k, &self.storage.view(), filter)?;
+        let results = self.index.search_with_strategy(
+            query,
+            search_k,
+            &self.storage.view(),
+            filter,
+            strategy,
+        )?;
 
         let mapped: Vec<(VectorId, f32)> = results
             .into_iter()
@@ -1,6 +1,6 @@
 //! Quantization module for vector compression
 //!
-//! Provides SQ8 (Scalar Quantization to 8-bit) and Binary Quantization
+//! Provides SQ8 (Scalar Quantization to 8-bit), FP16 and Binary Quantization
 //! for significant memory reduction with minimal accuracy loss.
 //!
 //! ## SQ8 (Scalar Quantization)
@@ -8,6 +8,19 @@
 //! - Uses min-max scaling per vector
 //! - Typical recall loss: < 5% for most embedding models
 //!
+//! ## U8 (Symmetric Scalar Quantization)
+//! - Same 4x layout as SQ8, but the query is quantized too
+//! - Distances come from an integer u8 x u8 dot product plus per-vector
+//!   precomputed sums, so the scan never widens stored codes to f32
+//! - The widest kernel the CPU supports is picked once, on first use:
+//!   AVX-512 VNNI (`vpdpbusd`), AVX2 (`vpmaddwd`), NEON (`umull`) or scalar
+//!   (see [`dot_u8_kernel_name`])
+//!
+//! ## F16 (Half Precision)
+//! - Converts f32 (4 bytes) to IEEE 754 binary16 (2 bytes) = **2x compression**
+//! - Near-lossless for normalized embeddings, for when SQ8 recall is too low
+//! - Uses F16C (`vcvtph2ps`) + FMA on x86_64, scalar conversion otherwise
+//!
 //! ## Binary Quantization (BQ)
 //! - Converts f32 to single bit = **32x compression**
 //! - Uses sign of each dimension
@@ -15,6 +28,7 @@
 
 use crate::distance::DistanceMetric;
 use serde::{Deserialize, Serialize};
+use std::sync::OnceLock;
 
 /// Quantization method to use
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Default, Serialize, Deserialize)]
@@ -24,6 +38,10 @@ pub enum QuantizationType {
     None,
     /// Scalar quantization to 8-bit (4x compression)
     SQ8,
+    /// Symmetric 8-bit quantization with integer distance kernels (4x compression)
+    U8,
+    /// Half-precision floats (2x compression)
+    F16,
     /// Binary quantization (32x compression)
     Binary,
 }
@@ -260,6 +278,552 @@ impl SQ8Quantizer {
     }
 }
 
+/// Metadata for U8 vectors: SQ8 scaling plus sums used by the integer kernels
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct U8Metadata {
+    /// Minimum value per vector (for denormalization)
+    pub min: f32,
+    /// Scale factor per vector (max - min) / 255
+    pub scale: f32,
+    /// Sum of the u8 codes
+    pub code_sum: u32,
+    /// Squared L2 norm of the dequantized vector
+    pub norm_sq: f32,
+}
+
+impl U8Metadata {
+    #[inline]
+    fn as_sq8(&self) -> SQ8Metadata {
+        SQ8Metadata {
+            min: self.min,
+            scale: self.scale,
+        }
+    }
+}
+
+/// U8 Quantizer - symmetric u8 x u8 distances on SQ8-encoded vectors
+///
+/// With `v = code * scale + min`, the dot product of two vectors expands to
+/// `sa*sb*D + sa*mb*Sa + ma*sb*Sb + n*ma*mb`, where `D` is the integer dot
+/// product of the codes and `Sa`/`Sb` are the code sums. Norms are stored at
+/// insert time, so each distance needs a single pass over the bytes.
+#[derive(Debug, Clone)]
+pub struct U8Quantizer {
+    sq8: SQ8Quantizer,
+}
+
+impl U8Quantizer {
+    /// Create a new U8 quantizer
+    pub fn new(dimensions: usize) -> Self {
+        Self {
+            sq8: SQ8Quantizer::new(dimensions),
+        }
+    }
+
+    /// Quantize a f32 vector to u8 with metadata
+    pub fn quantize(&self, vector: &[f32]) -> (Vec<u8>, U8Metadata) {
+        let (quantized, sq8_meta) = self.sq8.quantize(vector);
+        let code_sum = quantized.iter().map(|&c| c as u32).sum();
+        let norm_sq = quantized
+            .iter()
+            .map(|&c| {
+                let v = sq8_meta.dequantize_value(c);
+                v * v
+            })
+            .sum();
+
+        let metadata = U8Metadata {
+            min: sq8_meta.min,
+            scale: sq8_meta.scale,
+            code_sum,
+            norm_sq,
+        };
+        (quantized, metadata)
+    }
+
+    /// Dequantize a u8 vector back to f32
+    pub fn dequantize(&self, quantized: &[u8], metadata: &U8Metadata) -> Vec<f32> {
+        self.sq8.dequantize(quantized, &metadata.as_sq8())
+    }
+
+    /// Calculate symmetric distance: quantized query (u8) vs stored (u8)
+    #[inline]
+    pub fn symmetric_distance(
+        &self,
+        query: &[u8],
+        query_meta: &U8Metadata,
+        quantized: &[u8],
+        metadata: &U8Metadata,
+        metric: DistanceMetric,
+    ) -> f32 {
+        let n = self.sq8.dimensions() as f32;
+        let d = dot_u8(query, quantized) as f32;
+        let dot = query_meta.scale * metadata.scale * d
+            + query_meta.scale * metadata.min * query_meta.code_sum as f32
+            + query_meta.min * metadata.scale * metadata.code_sum as f32
+            + n * query_meta.min * metadata.min;
+
+        match metric {
+            DistanceMetric::Cosine => {
+                let denom = (query_meta.norm_sq * metadata.norm_sq).sqrt();
+                if denom == 0.0 {
+                    return 1.0;
+                }
+                1.0 - (dot / denom)
+            }
+            DistanceMetric::Euclidean => (query_meta.norm_sq + metadata.norm_sq - 2.0 * dot)
+                .max(0.0)
+                .sqrt(),
+            DistanceMetric::DotProduct => 1.0 - dot,
+        }
+    }
+
+    /// Calculate asymmetric distance: query (f32) vs stored (u8)
+    ///
+    /// Used when the query has not been quantized up front (e.g. during insert).
+    #[inline]
+    pub fn asymmetric_distance(
+        &self,
+        query: &[f32],
+        quantized: &[u8],
+        metadata: &U8Metadata,
+        metric: DistanceMetric,
+    ) -> f32 {
+        self.sq8
+            .asymmetric_distance(query, quantized, &metadata.as_sq8(), metric)
+    }
+
+    /// Get dimensions
+    pub fn dimensions(&self) -> usize {
+        self.sq8.dimensions()
+    }
+}
+
+/// Signature shared by the u8 dot-product kernels
+type DotU8Kernel = fn(&[u8], &[u8]) -> u32;
+
+/// Integer dot product of two u8 vectors
+#[inline]
+pub fn dot_u8(a: &[u8], b: &[u8]) -> u32 {
+    debug_assert_eq!(a.len(), b.len(), "Vectors must have same length");
+
+    (dot_u8_kernel().1)(a, b)
+}
+
+/// Name of the u8 dot-product kernel selected for this CPU: `"avx512_vnni"`,
+/// `"avx2"`, `"neon"` or `"scalar"`
+pub fn dot_u8_kernel_name() -> &'static str {
+    dot_u8_kernel().0
+}
+
+/// CPU feature detection runs once; every later call is a single indirect call
+fn dot_u8_kernel() -> &'static (&'static str, DotU8Kernel) {
+    static KERNEL: OnceLock<(&'static str, DotU8Kernel)> = OnceLock::new();
+    KERNEL.get_or_init(select_dot_u8_kernel)
+}
+
+fn select_dot_u8_kernel() -> (&'static str, DotU8Kernel) {
+    #[cfg(all(target_arch = "x86_64", feature = "simd"))]
+    {
+        if is_x86_feature_detected!("avx512vnni") && is_x86_feature_detected!("avx512bw") {
+            return ("avx512_vnni", |a, b| unsafe { dot_u8_avx512_vnni(a, b) });
+        }
+        if is_x86_feature_detected!("avx2") {
+            return ("avx2", |a, b| unsafe { dot_u8_avx2(a, b) });
+        }
+    }
+
+    #[cfg(target_arch = "aarch64")]
+    {
+        ("neon", dot_u8_neon)
+    }
+
+    #[cfg(not(target_arch = "aarch64"))]
+    {
+        ("scalar", dot_u8_scalar)
+    }
+}
+
+#[inline]
+#[allow(dead_code)]
+fn dot_u8_scalar(a: &[u8], b: &[u8]) -> u32 {
+    a.iter()
+        .zip(b.iter())
+        .map(|(&x, &y)| x as u32 * y as u32)
+        .sum()
+}
+
+#[cfg(all(target_arch = "x86_64", feature = "simd"))]
+#[target_feature(enable = "avx512f,avx512bw,avx512vnni")]
+unsafe fn dot_u8_avx512_vnni(a: &[u8], b: &[u8]) -> u32 {
+    use std::arch::x86_64::*;
+
+    let n = a.len();
+    let chunks = n / 64;
+
+    // vpdpbusd multiplies unsigned by *signed* bytes: flip b's top bit to use
+    // b - 128, then add back 128 * sum(a) at the end
+    let bias = _mm512_set1_epi8(i8::MIN);
+    let ones = _mm512_set1_epi8(1);
+    let mut acc = _mm512_setzero_si512();
+    let mut sum_a = _mm512_setzero_si512();
+
+    for i in 0..chunks {
+        let offset = i * 64;
+        let va = _mm512_loadu_si512(a.as_ptr().add(offset).cast());
+        let vb = _mm512_xor_si512(_mm512_loadu_si512(b.as_ptr().add(offset).cast()), bias);
+
+        acc = _mm512_dpbusd_epi32(acc, va, vb);
+        sum_a = _mm512_dpbusd_epi32(sum_a, va, ones);
+    }
+
+    // Handle remainder with masked loads; masked-off lanes of a are zero
+    let remainder = n - chunks * 64;
+    if remainder > 0 {
+        let offset = chunks * 64;
+        let mask: __mmask64 = (1u64 << remainder) - 1;
+        let va = _mm512_maskz_loadu_epi8(mask, a.as_ptr().add(offset).cast());
+        let vb = _mm512_xor_si512(
+            _mm512_maskz_loadu_epi8(mask, b.as_ptr().add(offset).cast()),
+            bias,
+        );
+
+        acc = _mm512_dpbusd_epi32(acc, va, vb);
+        sum_a = _mm512_dpbusd_epi32(sum_a, va, ones);
+    }
+
+    let dot = _mm512_reduce_add_epi32(acc) as i64 + 128 * _mm512_reduce_add_epi32(sum_a) as i64;
+    dot as u32
+}
+
+#[cfg(all(target_arch = "x86_64", feature = "simd"))]
+#[target_feature(enable = "avx2")]
+unsafe fn dot_u8_avx2(a: &[u8], b: &[u8]) -> u32 {
+    use std::arch::x86_64::*;
+
+    let n = a.len();
+    let chunks = n / 32;
+
+    let mut acc = _mm256_setzero_si256();
+
+    for i in 0..chunks {
+        let offset = i * 32;
+        let va = _mm256_loadu_si256(a.as_ptr().add(offset) as *const __m256i);
+        let vb = _mm256_loadu_si256(b.as_ptr().add(offset) as *const __m256i);
+
+        // Zero-extend u8 -> i16, then vpmaddwd sums adjacent products into i32
+        let a_lo = _mm256_cvtepu8_epi16(_mm256_castsi256_si128(va));
+        let a_hi = _mm256_cvtepu8_epi16(_mm256_extracti128_si256(va, 1));
+        let b_lo = _mm256_cvtepu8_epi16(_mm256_castsi256_si128(vb));
+        let b_hi = _mm256_cvtepu8_epi16(_mm256_extracti128_si256(vb, 1));
+
+        acc = _mm256_add_epi32(acc, _mm256_madd_epi16(a_lo, b_lo));
+        acc = _mm256_add_epi32(acc, _mm256_madd_epi16(a_hi, b_hi));
+    }
+
+    // Horizontal sum
+    let sum128 = _mm_add_epi32(
+        _mm256_castsi256_si128(acc),
+        _mm256_extracti128_si256(acc, 1),
+    );
+    let sum64 = _mm_add_epi32(sum128, _mm_shuffle_epi32(sum128, 0b01_00_11_10));
+    let sum32 = _mm_add_epi32(sum64, _mm_shuffle_epi32(sum64, 0b10_11_00_01));
+    let mut total = _mm_cvtsi128_si32(sum32) as u32;
+
+    // Handle remainder
+    for i in (chunks * 32)..n {
+        total += a[i] as u32 * b[i] as u32;
+    }
+
+    total
+}
+
+#[cfg(target_arch = "aarch64")]
+#[inline]
+fn dot_u8_neon(a: &[u8], b: &[u8]) -> u32 {
+    use std::arch::aarch64::*;
+
+    let n = a.len();
+    let chunks = n / 16;
+
+    unsafe {
+        let mut acc = vdupq_n_u32(0);
+
+        for i in 0..chunks {
+            let offset = i * 16;
+            let va = vld1q_u8(a.as_ptr().add(offset));
+            let vb = vld1q_u8(b.as_ptr().add(offset));
+
+            // u8 x u8 -> u16 products, pairwise-accumulated into u32 lanes
+            let lo = vmull_u8(vget_low_u8(va), vget_low_u8(vb));
+            let hi = vmull_high_u8(va, vb);
+            acc = vpadalq_u16(acc, lo);
+            acc = vpadalq_u16(acc, hi);
+        }
+
+        let mut total = vaddvq_u32(acc);
+
+        // Handle remainder
+        for i in (chunks * 16)..n {
+            total += a[i] as u32 * b[i] as u32;
+        }
+
+        total
+    }
+}
+
+/// Convert a f32 to IEEE 754 binary16 bits (round to nearest even)
+#[inline]
+pub fn f32_to_f16(value: f32) -> u16 {
+    let bits = value.to_bits();
+    let sign = ((bits >> 16) & 0x8000) as u16;
+    let exp = ((bits >> 23) & 0xff) as i32;
+    let mant = bits & 0x7f_ffff;
+
+    // Infinity / NaN
+    if exp == 0xff {
+        let nan = if mant != 0 { 0x0200 } else { 0 };
+        return sign | 0x7c00 | nan;
+    }
+
+    let half_exp = exp - 127 + 15;
+
+    // Overflow -> infinity
+    if half_exp >= 0x1f {
+        return sign | 0x7c00;
+    }
+
+    // Subnormal or zero
+    if half_exp <= 0 {
+        if half_exp < -10 {
+            return sign;
+        }
+        let m = mant | 0x80_0000;
+        let shift = (14 - half_exp) as u32;
+        let rounded = m + (1 << (shift - 1)) - 1 + ((m >> shift) & 1);
+        return sign | (rounded >> shift) as u16;
+    }
+
+    // Normal: a carry out of the mantissa correctly bumps the exponent
+    let mut half = ((half_exp as u32) << 10) | (mant >> 13);
+    let round_bits = mant & 0x1fff;
+    if round_bits > 0x1000 || (round_bits == 0x1000 && (half & 1) == 1) {
+        half += 1;
+    }
+    sign | half as u16
+}
+
+/// Convert IEEE 754 binary16 bits to f32
+#[inline]
+pub fn f16_to_f32(half: u16) -> f32 {
+    let sign = ((half & 0x8000) as u32) << 16;
+    let exp = ((half >> 10) & 0x1f) as u32;
+    let mant = (half & 0x03ff) as u32;
+
+    match exp {
+        0 => {
+            // Zero / subnormal: mant * 2^-24 is exact in f32
+            let value = mant as f32 * (1.0 / 16_777_216.0);
+            if sign != 0 {
+                -value
+            } else {
+                value
+            }
+        }
+        0x1f => f32::from_bits(sign | 0x7f80_0000 | (mant << 13)),
+        _ => f32::from_bits(sign | ((exp + 112) << 23) | (mant << 13)),
+    }
+}
+
+/// F16 Quantizer - stores vectors as half-precision floats (2x)
+#[derive(Debug, Clone)]
+pub struct F16Quantizer {
+    dimensions: usize,
+}
+
+impl F16Quantizer {
+    /// Create a new F16 quantizer
+    pub fn new(dimensions: usize) -> Self {
+        Self { dimensions }
+    }
+
+    /// Quantize a f32 vector to f16 bits
+    pub fn quantize(&self, vector: &[f32]) -> Vec<u16> {
+        vector.iter().map(|&v| f32_to_f16(v)).collect()
+    }
+
+    /// Dequantize f16 bits back to f32
+    pub fn dequantize(&self, quantized: &[u16]) -> Vec<f32> {
+        quantized.iter().map(|&v| f16_to_f32(v)).collect()
+    }
+
+    /// Calculate asymmetric distance: query (f32) vs stored (f16)
+    #[inline]
+    pub fn asymmetric_distance(
+        &self,
+        query: &[f32],
+        quantized: &[u16],
+        metric: DistanceMetric,
+    ) -> f32 {
+        match metric {
+            DistanceMetric::Cosine => {
+                let (dot, norm_q, norm_v) = dot_norms_f16(query, quantized);
+                let denom = (norm_q * norm_v).sqrt();
+                if denom == 0.0 {
+                    return 1.0;
+                }
+                1.0 - (dot / denom)
+            }
+            DistanceMetric::Euclidean => l2_squared_f16(query, quantized).sqrt(),
+            DistanceMetric::DotProduct => 1.0 - dot_norms_f16(query, quantized).0,
+        }
+    }
+
+    /// Get dimensions
+    pub fn dimensions(&self) -> usize {
+        self.dimensions
+    }
+}
+
+/// Dot product and both squared norms of a f32 query and a f16 vector
+#[inline]
+fn dot_norms_f16(query: &[f32], quantized: &[u16]) -> (f32, f32, f32) {
+    #[cfg(all(target_arch = "x86_64", feature = "simd"))]
+    {
+        if is_x86_feature_detected!("f16c") && is_x86_feature_detected!("fma") {
+            return unsafe { dot_norms_f16_f16c(query, quantized) };
+        }
+    }
+
+    dot_norms_f16_scalar(query, quantized)
+}
+
+/// Squared L2 distance between a f32 query and a f16 vector
+#[inline]
+fn l2_squared_f16(query: &[f32], quantized: &[u16]) -> f32 {
+    #[cfg(all(target_arch = "x86_64", feature = "simd"))]
+    {
+        if is_x86_feature_detected!("f16c") && is_x86_feature_detected!("fma") {
+            return unsafe { l2_squared_f16_f16c(query, quantized) };
+        }
+    }
+
+    l2_squared_f16_scalar(query, quantized)
+}
+
+#[inline]
+fn dot_norms_f16_scalar(query: &[f32], quantized: &[u16]) -> (f32, f32, f32) {
+    let mut dot = 0.0f32;
+    let mut norm_q = 0.0f32;
+    let mut norm_v = 0.0f32;
+
+    for i in 0..query.len() {
+        let q = query[i];
+        let v = f16_to_f32(quantized[i]);
+        dot += q * v;
+        norm_q += q * q;
+        norm_v += v * v;
+    }
+
+    (dot, norm_q, norm_v)
+}
+
+#[inline]
+fn l2_squared_f16_scalar(query: &[f32], quantized: &[u16]) -> f32 {
+    let mut sum = 0.0f32;
+    for i in 0..query.len() {
+        let diff = query[i] - f16_to_f32(quantized[i]);
+        sum += diff * diff;
+    }
+    sum
+}
+
+#[cfg(all(target_arch = "x86_64", feature = "simd"))]
+#[target_feature(enable = "avx,fma,f16c")]
+unsafe fn hsum_ps(v: std::arch::x86_64::__m256) -> f32 {
+    use std::arch::x86_64::*;
+
+    let high = _mm256_extractf128_ps(v, 1);
+    let low = _mm256_castps256_ps128(v);
+    let sum128 = _mm_add_ps(high, low);
+    let high64 = _mm_movehl_ps(sum128, sum128);
+    let sum64 = _mm_add_ps(sum128, high64);
+    let high32 = _mm_shuffle_ps(sum64, sum64, 1);
+    _mm_cvtss_f32(_mm_add_ss(sum64, high32))
+}
+
+#[cfg(all(target_arch = "x86_64", feature = "simd"))]
+#[target_feature(enable = "avx,fma,f16c")]
+unsafe fn dot_norms_f16_f16c(query: &[f32], quantized: &[u16]) -> (f32, f32, f32) {
+    use std::arch::x86_64::*;
+
+    let n = query.len();
+    let chunks = n / 8;
+
+    let mut dot_acc = _mm256_setzero_ps();
+    let mut norm_q_acc = _mm256_setzero_ps();
+    let mut norm_v_acc = _mm256_setzero_ps();
+
+    for i in 0..chunks {
+        let offset = i * 8;
+        let q = _mm256_loadu_ps(query.as_ptr().add(offset));
+        // 8 halves (128 bits) -> 8 f32 lanes in one vcvtph2ps
+        let v = _mm256_cvtph_ps(_mm_loadu_si128(
+            quantized.as_ptr().add(offset) as *const __m128i
+        ));
+
+        dot_acc = _mm256_fmadd_ps(q, v, dot_acc);
+        norm_q_acc = _mm256_fmadd_ps(q, q, norm_q_acc);
+        norm_v_acc = _mm256_fmadd_ps(v, v, norm_v_acc);
+    }
+
+    let mut dot = hsum_ps(dot_acc);
+    let mut norm_q = hsum_ps(norm_q_acc);
+    let mut norm_v = hsum_ps(norm_v_acc);
+
+    // Handle remainder
+    for i in (chunks * 8)..n {
+        let q = query[i];
+        let v = f16_to_f32(quantized[i]);
+        dot += q * v;
+        norm_q += q * q;
+        norm_v += v * v;
+    }
+
+    (dot, norm_q, norm_v)
+}
+
+#[cfg(all(target_arch = "x86_64", feature = "simd"))]
+#[target_feature(enable = "avx,fma,f16c")]
+unsafe fn l2_squared_f16_f16c(query: &[f32], quantized: &[u16]) -> f32 {
+    use std::arch::x86_64::*;
+
+    let n = query.len();
+    let chunks = n / 8;
+
+    let mut sum_acc = _mm256_setzero_ps();
+
+    for i in 0..chunks {
+        let offset = i * 8;
+        let q = _mm256_loadu_ps(query.as_ptr().add(offset));
+        let v = _mm256_cvtph_ps(_mm_loadu_si128(
+            quantized.as_ptr().add(offset) as *const __m128i
+        ));
+        let diff = _mm256_sub_ps(q, v);
+        sum_acc = _mm256_fmadd_ps(diff, diff, sum_acc);
+    }
+
+    let mut sum = hsum_ps(sum_acc);
+
+    // Handle remainder
+    for i in (chunks * 8)..n {
+        let diff = query[i] - f16_to_f32(quantized[i]);
+        sum += diff * diff;
+    }
+
+    sum
+}
+
 /// Binary Quantizer - extreme compression (32x)
 #[derive(Debug, Clone)]
 pub struct BinaryQuantizer {
@@ -401,6 +965,100 @@ mod tests {
         assert!(dist < 0.01, "dist={}", dist);
     }
 
+    #[test]
+    fn test_u8_dot_matches_scalar() {
+        // Odd length exercises both the SIMD body and the remainder loop
+        let a: Vec<u8> = (0..103).map(|i| (i * 7 % 256) as u8).collect();
+        let b: Vec<u8> = (0..103).map(|i| (255 - i * 3 % 256) as u8).collect();
+
+        assert_eq!(dot_u8(&a, &b), dot_u8_scalar(&a, &b));
+
+        // Saturated codes and lengths around the 32/64-byte SIMD widths
+        for n in [0, 1, 31, 32, 63, 64, 65, 768] {
+            let a = vec![255u8; n];
+            let b: Vec<u8> = (0..n).map(|i| (i % 256) as u8).collect();
+            assert_eq!(dot_u8(&a, &b), dot_u8_scalar(&a, &b), "n = {}", n);
+        }
+    }
+
+    #[test]
+    fn test_dot_u8_kernel_name() {
+        assert!(["avx512_vnni", "avx2", "neon", "scalar"].contains(&dot_u8_kernel_name()));
+    }
+
+    #[test]
+    fn test_u8_symmetric_distance() {
+        let quantizer = U8Quantizer::new(64);
+
+        let v1: Vec<f32> = (0..64).map(|i| (i as f32 * 0.1).sin()).collect();
+        let v2: Vec<f32> = (0..64).map(|i| (i as f32 * 0.1).cos()).collect();
+
+        let (q1, meta1) = quantizer.quantize(&v1);
+        let (q2, meta2) = quantizer.quantize(&v2);
+
+        for metric in [
+            DistanceMetric::Cosine,
+            DistanceMetric::Euclidean,
+            DistanceMetric::DotProduct,
+        ] {
+            let exact = metric.distance(&v1, &v2);
+            let dist = quantizer.symmetric_distance(&q1, &meta1, &q2, &meta2, metric);
+            assert!(
+                (exact - dist).abs() < 0.05,
+                "{:?}: exact={}, u8={}",
+                metric,
+                exact,
+                dist
+            );
+        }
+
+        let self_dist =
+            quantizer.symmetric_distance(&q1, &meta1, &q1, &meta1, DistanceMetric::Cosine);
+        assert!(self_dist < 0.01, "self_dist={}", self_dist);
+    }
+
+    #[test]
+    fn test_f16_roundtrip() {
+        for &v in &[0.0f32, -0.0, 1.0, -2.5, 0.1, 65504.0, 6.1e-5, 5.96e-8] {
+            let back = f16_to_f32(f32_to_f16(v));
+            assert!(
+                (v - back).abs() <= v.abs() * 1e-3 + 1e-7,
+                "v={}, back={}",
+                v,
+                back
+            );
+        }
+
+        assert_eq!(f32_to_f16(1.0), 0x3c00);
+        assert_eq!(f32_to_f16(65520.0), 0x7c00); // rounds to infinity
+        assert!(f16_to_f32(f32_to_f16(f32::NAN)).is_nan());
+    }
+
+    #[test]
+    fn test_f16_asymmetric_distance() {
+        let quantizer = F16Quantizer::new(37);
+
+        let v1: Vec<f32> = (0..37).map(|i| (i as f32 * 0.1).sin()).collect();
+        let v2: Vec<f32> = (0..37).map(|i| (i as f32 * 0.1).cos()).collect();
+        let q2 = quantizer.quantize(&v2);
+
+        for metric in [
+            DistanceMetric::Cosine,
+            DistanceMetric::Euclidean,
+            DistanceMetric::DotProduct,
+        ] {
+            let exact = metric.distance(&v1, &v2);
+            let dist = quantizer.asymmetric_distance(&v1, &q2, metric);
+            assert!(
+                (exact - dist).abs() < 1e-3,
+                "{:?}: exact={}, f16={}",
+                metric,
+                exact,
+                dist
+            );
+        }
+    }
+
     #[test]
     fn test_binary_quantize() {
         let quantizer = BinaryQuantizer::new(8);
@@ -440,6 +1098,10 @@ mod tests {
         let sq8_ratio = f32_size as f32 / sq8_size as f32;
         assert!(sq8_ratio > 3.9, "SQ8 compression ratio: {}", sq8_ratio);
 
+        // F16: 4 bytes -> 2 bytes = 2x compression
+        let f16_ratio = f32_size as f32 / (dims * 2) as f32;
+        assert_eq!(f16_ratio, 2.0);
+
         // Binary: 4 bytes -> 1/8 byte = 32x compression
         let binary_size = (dims + 7) / 8;
         let binary_ratio = f32_size as f32 / binary_size as f32;
@@ -1,10 +1,13 @@
 //! Quantized vector storage implementation
 //!
-//! Provides memory-efficient storage using SQ8 or Binary quantization.
+//! Provides memory-efficient storage using SQ8, U8, F16 or Binary quantization.
 
 use crate::distance::DistanceMetric;
 use crate::error::{Error, Result};
-use crate::quantization::{BinaryQuantizer, QuantizationType, SQ8Metadata, SQ8Quantizer};
+use crate::quantization::{
+    BinaryQuantizer, F16Quantizer, QuantizationType, SQ8Metadata, SQ8Quantizer, U8Metadata,
+    U8Quantizer,
+};
 use crate::storage::VectorStorageTrait;
 use crate::sync::RwLock;
 use crate::types::{InternalId, VectorId};
@@ -22,6 +25,12 @@ pub struct QuantizedStorage {
     /// SQ8 quantizer (if using SQ8)
     sq8_quantizer: Option<SQ8Quantizer>,
 
+    /// U8 quantizer (if using U8)
+    u8_quantizer: Option<U8Quantizer>,
+
+    /// F16 quantizer (if using F16)
+    f16_quantizer: Option<F16Quantizer>,
+
     /// Binary quantizer (if using Binary)
     binary_quantizer: Option<BinaryQuantizer>,
 
@@ -31,6 +40,15 @@ pub struct QuantizedStorage {
     /// SQ8: Metadata for each vector
     sq8_metadata: RwLock<Vec<SQ8Metadata>>,
 
+    /// U8: Quantized vectors (contiguous u8 storage)
+    u8_vectors: RwLock<Vec<u8>>,
+
+    /// U8: Metadata for each vector
+    u8_metadata: RwLock<Vec<U8Metadata>>,
+
+    /// F16: Half-precision vectors (contiguous binary16 bits)
+    f16_vectors: RwLock<Vec<u16>>,
+
     /// Binary: Quantized vectors
     binary_vectors: RwLock<Vec<u8>>,
 
@@ -62,6 +80,16 @@ impl QuantizedStorage {
             _ => None,
         };
 
+        let u8_quantizer = match quantization {
+            QuantizationType::U8 => Some(U8Quantizer::new(dimensions)),
+            _ => None,
+        };
+
+        let f16_quantizer = match quantization {
+            QuantizationType::F16 => Some(F16Quantizer::new(dimensions)),
+            _ => None,
+        };
+
         let binary_quantizer = match quantization {
             QuantizationType::Binary => Some(BinaryQuantizer::new(dimensions)),
             _ => None,
@@ -79,9 +107,14 @@ impl QuantizedStorage {
             dimensions,
             quantization,
             sq8_quantizer,
+            u8_quantizer,
+            f16_quantizer,
             binary_quantizer,
             sq8_vectors: RwLock::new(Vec::new()),
             sq8_metadata: RwLock::new(Vec::new()),
+            u8_vectors: RwLock::new(Vec::new()),
+            u8_metadata: RwLock::new(Vec::new()),
+            f16_vectors: RwLock::new(Vec::new()),
             binary_vectors: RwLock::new(Vec::new()),
             original_vectors: RwLock::new(original_vectors),
             keep_originals,
@@ -174,6 +207,23 @@ impl QuantizedStorage {
                 sq8_vectors.extend_from_slice(&quantized);
                 sq8_metadata.push(sq8_meta);
             }
+            QuantizationType::U8 => {
+                let quantizer = self.u8_quantizer.as_ref().unwrap();
+                let (quantized, u8_meta) = quantizer.quantize(vector);
+
+                let mut u8_vectors = self.u8_vectors.write();
+                let mut u8_metadata = self.u8_metadata.write();
+
+                u8_vectors.extend_from_slice(&quantized);
+                u8_metadata.push(u8_meta);
+            }
+            QuantizationType::F16 => {
+                let quantizer = self.f16_quantizer.as_ref().unwrap();
+                let quantized = quantizer.quantize(vector);
+
+                let mut f16_vectors = self.f16_vectors.write();
+                f16_vectors.extend_from_slice(&quantized);
+            }
             QuantizationType::Binary => {
                 let quantizer = self.binary_quantizer.as_ref().unwrap();
                 let quantized = quantizer.quantize(vector);
@@ -237,6 +287,21 @@ impl QuantizedStorage {
         } else {
             None
         };
+        let mut u8_vectors = if self.quantization == QuantizationType::U8 {
+            Some(self.u8_vectors.write())
+        } else {
+            None
+        };
+        let mut u8_metadata = if self.quantization == QuantizationType::U8 {
+            Some(self.u8_metadata.write())
+        } else {
+            None
+        };
+        let mut f16_vectors = if self.quantization == QuantizationType::F16 {
+            Some(self.f16_vectors.write())
+        } else {
+            None
+        };
         let mut binary_vectors = if self.quantization == QuantizationType::Binary {
             Some(self.binary_vectors.write())
         } else {
@@ -275,6 +340,23 @@ impl QuantizedStorage {
                         m.push(sq8_meta);
                     }
                 }
+                QuantizationType::U8 => {
+                    let quantizer = self.u8_quantizer.as_ref().unwrap();
+                    let (quantized, u8_meta) = quantizer.quantize(vector);
+                    if let Some(ref mut v) = u8_vectors {
+                        v.extend_from_slice(&quantized);
+                    }
+                    if let Some(ref mut m) = u8_metadata {
+                        m.push(u8_meta);
+                    }
+                }
+                QuantizationType::F16 => {
+                    let quantizer = self.f16_quantizer.as_ref().unwrap();
+                    let quantized = quantizer.quantize(vector);
+                    if let Some(ref mut v) = f16_vectors {
+                        v.extend_from_slice(&quantized);
+                    }
+                }
                 QuantizationType::Binary => {
                     let quantizer = self.binary_quantizer.as_ref().unwrap();
                     let quantized = quantizer.quantize(vector);
@@ -346,6 +428,39 @@ impl QuantizedStorage {
 
                 Some(quantizer.asymmetric_distance(query, quantized, metadata, metric))
             }
+            QuantizationType::U8 => {
+                let quantizer = self.u8_quantizer.as_ref()?;
+                let u8_vectors = self.u8_vectors.read();
+                let u8_metadata = self.u8_metadata.read();
+
+                let idx = internal_id.as_usize();
+                if idx >= u8_metadata.len() {
+                    return None;
+                }
+
+                let start = idx * self.dimensions;
+                let end = start + self.dimensions;
+                if end > u8_vectors.len() {
+                    return None;
+                }
+
+                let quantized = &u8_vectors[start..end];
+                let metadata = &u8_metadata[idx];
+
+                Some(quantizer.asymmetric_distance(query, quantized, metadata, metric))
+            }
+            QuantizationType::F16 => {
+                let quantizer = self.f16_quantizer.as_ref()?;
+                let f16_vectors = self.f16_vectors.read();
+
+                let start = internal_id.as_usize() * self.dimensions;
+                let end = start + self.dimensions;
+                if end > f16_vectors.len() {
+                    return None;
+                }
+
+                Some(quantizer.asymmetric_distance(query, &f16_vectors[start..end], metric))
+            }
             QuantizationType::Binary => {
                 let quantizer = self.binary_quantizer.as_ref()?;
                 let binary_vectors = self.binary_vectors.read();
@@ -421,6 +536,11 @@ impl QuantizedStorage {
                 self.sq8_vectors.read().len()
                     + self.sq8_metadata.read().len() * std::mem::size_of::<SQ8Metadata>()
             }
+            QuantizationType::U8 => {
+                self.u8_vectors.read().len()
+                    + self.u8_metadata.read().len() * std::mem::size_of::<U8Metadata>()
+            }
+            QuantizationType::F16 => self.f16_vectors.read().len() * 2,
             QuantizationType::Binary => self.binary_vectors.read().len(),
         };
 
@@ -463,6 +583,19 @@ impl QuantizedStorage {
 
     /// Create a view of the storage that holds read locks
     pub fn view(&self) -> QuantizedStorageView<'_> {
+        self.view_with_query(None)
+    }
+
+    /// Create a view that also holds `query` pre-quantized.
+    ///
+    /// Index searches call `distance` with the same query slice for every
+    /// candidate; binding it here lets U8 storage quantize the query once and
+    /// use the symmetric integer kernels for the whole search.
+    pub fn view_for_query<'a>(&'a self, query: &'a [f32]) -> QuantizedStorageView<'a> {
+        self.view_with_query(Some(query))
+    }
+
+    fn view_with_query<'a>(&'a self, query: Option<&'a [f32]>) -> QuantizedStorageView<'a> {
         let (sq8_vectors, sq8_metadata) = if self.quantization == QuantizationType::SQ8 {
             (
                 Some(self.sq8_vectors.read()),
@@ -472,6 +605,18 @@ impl QuantizedStorage {
             (None, None)
         };
 
+        let (u8_vectors, u8_metadata) = if self.quantization == QuantizationType::U8 {
+            (Some(self.u8_vectors.read()), Some(self.u8_metadata.read()))
+        } else {
+            (None, None)
+        };
+
+        let f16_vectors = if self.quantization == QuantizationType::F16 {
+            Some(self.f16_vectors.read())
+        } else {
+            None
+        };
+
         let binary_vectors = if self.quantization == QuantizationType::Binary {
             Some(self.binary_vectors.read())
         } else {
@@ -484,13 +629,21 @@ impl QuantizedStorage {
             None
         };
 
+        let query = query.map(|q| (q, self.quantize_query(q)));
+
         QuantizedStorageView {
             dimensions: self.dimensions,
             quantization: self.quantization,
             sq8_quantizer: self.sq8_quantizer.as_ref(),
+            u8_quantizer: self.u8_quantizer.as_ref(),
+            f16_quantizer: self.f16_quantizer.as_ref(),
             binary_quantizer: self.binary_quantizer.as_ref(),
+            query,
             sq8_vectors,
             sq8_metadata,
+            u8_vectors,
+            u8_metadata,
+            f16_vectors,
             binary_vectors,
             original_vectors,
             metadata: Some(self.metadata.read()),
@@ -510,6 +663,15 @@ impl QuantizedStorage {
                 // So no quantization needed for query.
                 QuantizedQuery::SQ8
             }
+            QuantizationType::U8 => {
+                if let Some(quantizer) = &self.u8_quantizer {
+                    let (quantized, metadata) = quantizer.quantize(query);
+                    QuantizedQuery::U8(quantized, metadata)
+                } else {
+                    QuantizedQuery::None
+                }
+            }
+            QuantizationType::F16 => QuantizedQuery::None,
             QuantizationType::Binary => {
                 if let Some(quantizer) = &self.binary_quantizer {
                     let binary = quantizer.quantize(query);
@@ -550,6 +712,36 @@ impl VectorStorageTrait for QuantizedStorage {
 
                 Some(quantizer.dequantize(&sq8_vectors[start..end], &sq8_metadata[idx]))
             }
+            QuantizationType::U8 => {
+                let quantizer = self.u8_quantizer.as_ref()?;
+                let u8_vectors = self.u8_vectors.read();
+                let u8_metadata = self.u8_metadata.read();
+
+                let idx = internal_id.as_usize();
+                if idx >= u8_metadata.len() {
+                    return None;
+                }
+
+                let start = idx * self.dimensions;
+                let end = start + self.dimensions;
+                if end > u8_vectors.len() {
+                    return None;
+                }
+
+                Some(quantizer.dequantize(&u8_vectors[start..end], &u8_metadata[idx]))
+            }
+            QuantizationType::F16 => {
+                let quantizer = self.f16_quantizer.as_ref()?;
+                let f16_vectors = self.f16_vectors.read();
+
+                let start = internal_id.as_usize() * self.dimensions;
+                let end = start + self.dimensions;
+                if end > f16_vectors.len() {
+                    return None;
+                }
+
+                Some(quantizer.dequantize(&f16_vectors[start..end]))
+            }
             QuantizationType::Binary => {
                 // Binary cannot be easily dequantized to f32 without massive loss
                 None
@@ -576,6 +768,7 @@ impl VectorStorageTrait for QuantizedStorage {
 pub enum QuantizedQuery {
     None,
     SQ8, // Placeholder as we use asymmetric distance (f32 query)
+    U8(Vec<u8>, U8Metadata),
     Binary(Vec<u8>),
 }
 
@@ -584,9 +777,16 @@ pub struct QuantizedStorageView<'a> {
     dimensions: usize,
     quantization: QuantizationType,
     sq8_quantizer: Option<&'a SQ8Quantizer>,
+    u8_quantizer: Option<&'a U8Quantizer>,
+    f16_quantizer: Option<&'a F16Quantizer>,
     binary_quantizer: Option<&'a BinaryQuantizer>,
+    /// Query bound by `view_for_query`, with its pre-quantized form
+    query: Option<(&'a [f32], QuantizedQuery)>,
     sq8_vectors: Option<crate::sync::RwLockReadGuard<'a, Vec<u8>>>,
     sq8_metadata: Option<crate::sync::RwLockReadGuard<'a, Vec<SQ8Metadata>>>,
+    u8_vectors: Option<crate::sync::RwLockReadGuard<'a, Vec<u8>>>,
+    u8_metadata: Option<crate::sync::RwLockReadGuard<'a, Vec<U8Metadata>>>,
+    f16_vectors: Option<crate::sync::RwLockReadGuard<'a, Vec<u16>>>,
     binary_vectors: Option<crate::sync::RwLockReadGuard<'a, Vec<u8>>>,
     original_vectors: Option<crate::sync::RwLockReadGuard<'a, Option<Vec<f32>>>>,
     metadata: Option<crate::sync::RwLockReadGuard<'a, HashMap<InternalId, Value>>>,
@@ -635,6 +835,46 @@ impl<'a> QuantizedStorageView<'a> {
 
                 Some(quantizer.asymmetric_distance(query, quantized, metadata, metric))
             }
+            QuantizationType::U8 => {
+                let quantizer = self.u8_quantizer?;
+                let u8_vectors = self.u8_vectors.as_ref()?;
+                let u8_metadata = self.u8_metadata.as_ref()?;
+
+                let idx = internal_id.as_usize();
+                if idx >= u8_metadata.len() {
+                    return None;
+                }
+
+                let start = idx * self.dimensions;
+                let end = start + self.dimensions;
+                if end > u8_vectors.len() {
+                    return None;
+                }
+
+                let quantized = &u8_vectors[start..end];
+                let metadata = &u8_metadata[idx];
+
+                // Symmetric integer path when the query is pre-quantized
+                match quantized_query {
+                    QuantizedQuery::U8(query_u8, query_meta) => Some(
+                        quantizer
+                            .symmetric_distance(query_u8, query_meta, quantized, metadata, metric),
+                    ),
+                    _ => Some(quantizer.asymmetric_distance(query, quantized, metadata, metric)),
+                }
+            }
+            QuantizationType::F16 => {
+                let quantizer = self.f16_quantizer?;
+                let f16_vectors = self.f16_vectors.as_ref()?;
+
+                let start = internal_id.as_usize() * self.dimensions;
+                let end = start + self.dimensions;
+                if end > f16_vectors.len() {
+                    return None;
+                }
+
+                Some(quantizer.asymmetric_distance(query, &f16_vectors[start..end], metric))
+            }
             QuantizationType::Binary => {
                 let quantizer = self.binary_quantizer?;
                 let binary_vectors = self.binary_vectors.as_ref()?;
@@ -660,15 +900,21 @@ impl<'a> QuantizedStorageView<'a> {
         }
     }
 
-    /// Calculate distance from query to stored vector (legacy/slow path)
+    /// Calculate distance from query to stored vector
+    ///
+    /// Uses the pre-quantized form when `query` is the slice bound by
+    /// `view_for_query`, otherwise falls back to the non-pre-quantized path.
     pub fn distance(
         &self,
         query: &[f32],
         internal_id: InternalId,
         metric: DistanceMetric,
     ) -> Option<f32> {
-        // Fallback to non-pre-quantized distance
-        self.distance_quantized(query, &QuantizedQuery::None, internal_id, metric)
+        let quantized_query = match &self.query {
+            Some((bound, quantized)) if std::ptr::eq(*bound, query) => quantized,
+            _ => &QuantizedQuery::None,
+        };
+        self.distance_quantized(query, quantized_query, internal_id, metric)
     }
 }
 
@@ -705,6 +951,36 @@ impl<'a> VectorStorageTrait for QuantizedStorageView<'a> {
 
                 Some(quantizer.dequantize(&sq8_vectors[start..end], &sq8_metadata[idx]))
             }
+            QuantizationType::U8 => {
+                let quantizer = self.u8_quantizer?;
+                let u8_vectors = self.u8_vectors.as_ref()?;
+                let u8_metadata = self.u8_metadata.as_ref()?;
+
+                let idx = internal_id.as_usize();
+                if idx >= u8_metadata.len() {
+                    return None;
+                }
+
+                let start = idx * self.dimensions;
+                let end = start + self.dimensions;
+                if end > u8_vectors.len() {
+                    return None;
+                }
+
+                Some(quantizer.dequantize(&u8_vectors[start..end], &u8_metadata[idx]))
+            }
+            QuantizationType::F16 => {
+                let quantizer = self.f16_quantizer?;
+                let f16_vectors = self.f16_vectors.as_ref()?;
+
+                let start = internal_id.as_usize() * self.dimensions;
+                let end = start + self.dimensions;
+                if end > f16_vectors.len() {
+                    return None;
+                }
+
+                Some(quantizer.dequantize(&f16_vectors[start..end]))
+            }
             QuantizationType::Binary => None,
         }
     }
@@ -715,8 +991,7 @@ impl<'a> VectorStorageTrait for QuantizedStorageView<'a> {
         query: &[f32],
         metric: DistanceMetric,
     ) -> Option<f32> {
-        // Fallback to non-pre-quantized distance
-        self.distance_quantized(query, &QuantizedQuery::None, internal_id, metric)
+        QuantizedStorageView::distance(self, query, internal_id, metric)
     }
 
     fn get_metadata(&self, internal_id: InternalId) -> Option<Value> {
@@ -778,6 +1053,25 @@ mod tests {
         assert!(dist2 > 0.0, "dist2={}", dist2);
     }
 
+    #[test]
+    fn test_u8_storage() {
+        let storage = QuantizedStorage::new(4, QuantizationType::U8, false);
+
+        let v1 = vec![1.0, 0.0, 0.0, 0.0];
+        let v2 = vec![0.0, 1.0, 0.0, 0.0];
+
+        let id1 = storage.insert("v1".into(), &v1, None).unwrap();
+        let id2 = storage.insert("v2".into(), &v2, None).unwrap();
+
+        // Query-bound view takes the symmetric u8 path
+        let view = storage.view_for_query(&v1);
+        let dist1 = view.distance(&v1, id1, DistanceMetric::Cosine).unwrap();
+        let dist2 = view.distance(&v1, id2, DistanceMetric::Cosine).unwrap();
+
+        assert!(dist1 < 0.01, "dist1={}", dist1);
+        assert!(dist2 > 0.9, "dist2={}", dist2);
+    }
+
     #[test]
     fn test_keep_originals() {
         let storage = QuantizedStorage::new(4, QuantizationType::SQ8, true);
@@ -805,4 +1099,20 @@ mod tests {
         // SQ8 should give ~4x compression (minus metadata overhead)
         assert!(ratio > 3.5, "compression ratio: {}", ratio);
     }
+
+    #[test]
+    fn test_f16_storage() {
+        let storage = QuantizedStorage::new(384, QuantizationType::F16, false);
+
+        let vector: Vec<f32> = (0..384).map(|j| (j as f32 / 100.0).sin()).collect();
+        let internal_id = storage.insert("v".into(), &vector, None).unwrap();
+
+        let dist = storage
+            .distance(&vector, internal_id, DistanceMetric::Cosine)
+            .unwrap();
+        assert!(dist < 1e-4, "dist={}", dist);
+
+        // F16 halves the storage exactly
+        assert_eq!(storage.compression_ratio(), 2.0);
+    }
 }
@@ -31,6 +31,14 @@ impl From<String> for VectorId {
     }
 }
 
+/// Integer IDs are stored as their decimal form, so `42` and `"42"` name the
+/// same vector
+impl From<u64> for VectorId {
+    fn from(id: u64) -> Self {
+        Self(id.to_string())
+    }
+}
+
 impl std::fmt::Display for VectorId {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
         write!(f, "{}", self.0)
@@ -1,5 +1,5 @@
 use serde_json::json;
-use surgedb_core::filter::Filter;
+use surgedb_core::filter::{Filter, FilterStrategy};
 use surgedb_core::{Config, VectorDb};
 
 #[test]
@@ -79,3 +79,48 @@ fn test_complex_filtering() {
     assert_eq!(results.len(), 1);
     assert_eq!(results[0].0.as_str(), "v1");
 }
+
+#[test]
+fn test_filter_strategies() {
+    let config = Config {
+        dimensions: 2,
+        ..Default::default()
+    };
+    let mut db = VectorDb::new(config).unwrap();
+
+    // Only 1 in 20 vectors matches, so Auto should pick the pre-filter scan
+    for i in 0..100 {
+        let category = if i % 20 == 0 { "rare" } else { "common" };
+        let angle = i as f32 * 0.01;
+        db.insert(
+            format!("vec{}", i),
+            &[angle.cos(), angle.sin()],
+            Some(json!({"category": category})),
+        )
+        .unwrap();
+    }
+
+    let filter = Filter::Exact("category".to_string(), json!("rare"));
+    let query = [1.0, 0.0];
+
+    // Pre scans every match, and Auto picks it for this selective filter
+    for strategy in [FilterStrategy::Pre, FilterStrategy::Auto] {
+        let results = db
+            .search_with_strategy(&query, 3, Some(&filter), strategy)
+            .unwrap();
+
+        assert_eq!(results.len(), 3, "{:?}", strategy);
+        assert_eq!(results[0].0.as_str(), "vec0", "{:?}", strategy);
+        assert_eq!(results[1].0.as_str(), "vec20", "{:?}", strategy);
+        assert_eq!(results[2].0.as_str(), "vec40", "{:?}", strategy);
+    }
+
+    // Post walks the graph and may stop before reaching all matches
+    let results = db
+        .search_with_strategy(&query, 3, Some(&filter), FilterStrategy::Post)
+        .unwrap();
+    assert!(!results.is_empty() && results.len() <= 3);
+    assert!(results
+        .iter()
+        .all(|(_, _, metadata)| metadata.as_ref().unwrap()["category"] == "rare"));
+}
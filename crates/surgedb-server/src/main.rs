@@ -2,7 +2,7 @@ use axum::{
     extract::{Json, Path, Query, Request, State},
     http::{header::HeaderName, HeaderValue, Method, StatusCode},
     middleware::{self, Next},
-    response::IntoResponse,
+    response::{IntoResponse, Response},
     routing::{delete, get, post},
     Router,
 };
@@ -12,7 +12,8 @@ use serde_json::Value;
 use std::net::SocketAddr;
 use std::sync::Arc;
 use std::time::{Duration, Instant};
-use surgedb_core::filter::Filter;
+use surgedb_core::db::Collection;
+use surgedb_core::filter::{Filter, FilterStrategy};
 use surgedb_core::{Config as DbConfig, Database, DistanceMetric, QuantizationType};
 use sysinfo::System;
 use tower_http::{
@@ -186,8 +187,27 @@ struct CreateCollectionRequest {
     quantization: Option<QuantizationType>,
 }
 
+/// Vector IDs may be sent as JSON strings or non-negative integers.
+fn deserialize_id<'de, D>(deserializer: D) -> Result<String, D::Error>
+where
+    D: serde::Deserializer<'de>,
+{
+    #[derive(Deserialize)]
+    #[serde(untagged)]
+    enum Id {
+        Int(u64),
+        Str(String),
+    }
+
+    Ok(match Id::deserialize(deserializer)? {
+        Id::Int(id) => id.to_string(),
+        Id::Str(id) => id,
+    })
+}
+
 #[derive(Deserialize, ToSchema)]
 struct InsertRequest {
+    #[serde(deserialize_with = "deserialize_id")]
     #[schema(example = "vec1")]
     id: String,
     #[schema(example = "[0.1, 0.2, 0.3]")]
@@ -207,9 +227,38 @@ struct SearchRequest {
     #[schema(example = 10)]
     k: usize,
     filter: Option<Filter>,
+    /// "Pre" scans the matching IDs exactly, "Post" filters during graph
+    /// traversal, "Auto" (default) picks based on filter selectivity.
+    #[serde(default)]
+    filter_strategy: Option<FilterStrategy>,
     /// When false, exclude metadata from response to reduce serialization overhead.
     #[serde(default)]
     include_metadata: Option<bool>,
+    /// "compact" returns the binary layout described on `ResponseFormat`.
+    #[serde(default)]
+    response_format: ResponseFormat,
+}
+
+#[derive(Deserialize, ToSchema)]
+struct BatchSearchRequest {
+    queries: Vec<SearchRequest>,
+    /// Applies to the whole batch; per-query `response_format` is ignored.
+    #[serde(default)]
+    response_format: ResponseFormat,
+}
+
+/// Search response encoding.
+///
+/// `compact` replies with `application/octet-stream`: per query a
+/// little-endian `u32` result count `n`, then `n` `u64` IDs, then `n` `f32`
+/// distances. Batch responses concatenate one such block per query. Metadata
+/// is never included, and every result ID must parse as a `u64`.
+#[derive(Deserialize, ToSchema, Clone, Copy, Debug, Default, PartialEq, Eq)]
+#[serde(rename_all = "lowercase")]
+enum ResponseFormat {
+    #[default]
+    Json,
+    Compact,
 }
 
 #[derive(Serialize, ToSchema)]
@@ -231,6 +280,9 @@ struct HealthResponse {
     version: String,
     uptime_seconds: u64,
     memory_usage_mb: u64,
+    /// u8 dot-product kernel picked for this CPU (e.g. "avx512_vnni", "avx2")
+    #[schema(example = "avx2")]
+    cpu_kernel: String,
 }
 
 #[derive(Serialize, ToSchema)]
@@ -274,11 +326,12 @@ struct VectorResponse {
         get_vector,
         delete_vector,
         search_vector,
+        batch_search_vector,
     ),
     components(
         schemas(
             CreateCollectionRequest, InsertRequest, BatchInsertRequest,
-            SearchRequest, SearchResult, ErrorResponse, HealthResponse,
+            SearchRequest, BatchSearchRequest, ResponseFormat, SearchResult, ErrorResponse, HealthResponse,
             StatsResponse, VectorResponse, MetricsSnapshot, VectorListEntry
         )
     ),
@@ -484,6 +537,7 @@ async fn main() {
             get(get_vector).delete(delete_vector),
         )
         .route("/collections/:name/search", post(search_vector))
+        .route("/collections/:name/search/batch", post(batch_search_vector))
         .layer(middleware::from_fn_with_state(
             state.clone(),
             auth_middleware,
@@ -606,6 +660,7 @@ async fn health_check(State(state): State<AppState>) -> Json<HealthResponse> {
         version: env!("CARGO_PKG_VERSION").to_string(),
         uptime_seconds: state.start_time.elapsed().as_secs(),
         memory_usage_mb: process_memory / 1024 / 1024,
+        cpu_kernel: surgedb_core::quantization::dot_u8_kernel_name().to_string(),
     })
 }
 
@@ -1066,7 +1121,7 @@ async fn list_vectors(
     ),
     request_body = SearchRequest,
     responses(
-        (status = 200, description = "List of nearest neighbors", body = [SearchResult]),
+        (status = 200, description = "List of nearest neighbors (binary when response_format is \"compact\", see ResponseFormat)", body = [SearchResult]),
         (status = 400, description = "Invalid request", body = ErrorResponse)
     ),
     security(("api_key" = []))
@@ -1075,13 +1130,8 @@ async fn search_vector(
     State(state): State<AppState>,
     Path(name): Path<String>,
     Json(payload): Json<SearchRequest>,
-) -> Result<Json<Vec<SearchResult>>, (StatusCode, Json<ErrorResponse>)> {
+) -> Result<Response, (StatusCode, Json<ErrorResponse>)> {
     let handler_start = Instant::now();
-    let include_metadata = payload.include_metadata.unwrap_or(true);
-    let vector = payload.vector;
-    let k = payload.k;
-    let filter = payload.filter;
-
     let collection = state.db.get_collection(&name).map_err(|e| {
         (
             StatusCode::NOT_FOUND,
@@ -1091,11 +1141,32 @@ async fn search_vector(
         )
     })?;
 
-    if include_metadata {
-        let work_start = Instant::now();
-        let result = tokio::task::spawn_blocking(move || {
-            collection.search(&vector, k, filter.as_ref())
-        })
+    let work_start = Instant::now();
+
+    if payload.response_format == ResponseFormat::Compact {
+        let result =
+            tokio::task::spawn_blocking(move || run_compact_search(&collection, [payload]))
+                .await
+                .map_err(|e| {
+                    (
+                        StatusCode::INTERNAL_SERVER_ERROR,
+                        Json(ErrorResponse {
+                            error: e.to_string(),
+                        }),
+                    )
+                })?;
+
+        let work_ms = work_start.elapsed().as_secs_f64() * 1000.0;
+        let total_ms = handler_start.elapsed().as_secs_f64() * 1000.0;
+        log_perf("search_vector", total_ms, work_ms, None, None);
+
+        return match result {
+            Ok(body) => Ok(compact_response(body)),
+            Err(error) => Err((StatusCode::BAD_REQUEST, Json(ErrorResponse { error }))),
+        };
+    }
+
+    let result = tokio::task::spawn_blocking(move || run_search(&collection, payload))
         .await
         .map_err(|e| {
             (
@@ -1106,68 +1177,197 @@ async fn search_vector(
             )
         })?;
 
-        match result {
-            Ok(results) => {
-                let map_start = Instant::now();
-                let response: Vec<SearchResult> = results
-                    .into_iter()
-                    .map(|(id, distance, metadata)| SearchResult {
-                        id: id.as_str().to_string(),
-                        distance,
-                        metadata,
-                    })
-                    .collect();
-                let work_ms = work_start.elapsed().as_secs_f64() * 1000.0;
-                let map_ms = map_start.elapsed().as_secs_f64() * 1000.0;
-                let total_ms = handler_start.elapsed().as_secs_f64() * 1000.0;
-                log_perf("search_vector", total_ms, work_ms, Some(map_ms), Some(response.len()));
-                Ok(Json(response))
-            }
-            Err(e) => Err((
-                StatusCode::BAD_REQUEST,
-                Json(ErrorResponse {
-                    error: e.to_string(),
-                }),
-            )),
+    match result {
+        Ok(response) => {
+            let work_ms = work_start.elapsed().as_secs_f64() * 1000.0;
+            let total_ms = handler_start.elapsed().as_secs_f64() * 1000.0;
+            log_perf(
+                "search_vector",
+                total_ms,
+                work_ms,
+                None,
+                Some(response.len()),
+            );
+            Ok(Json(response).into_response())
         }
-    } else {
-        let work_start = Instant::now();
-        let result = tokio::task::spawn_blocking(move || {
-            collection.search_ids(&vector, k, filter.as_ref())
-        })
-        .await
-        .map_err(|e| {
-            (
-                StatusCode::INTERNAL_SERVER_ERROR,
-                Json(ErrorResponse {
-                    error: e.to_string(),
-                }),
+        Err(e) => Err((
+            StatusCode::BAD_REQUEST,
+            Json(ErrorResponse {
+                error: e.to_string(),
+            }),
+        )),
+    }
+}
+
+/// Append one compact block (`u32` count, `u64` IDs, `f32` distances) to `out`.
+fn encode_compact(
+    results: &[(surgedb_core::VectorId, f32)],
+    out: &mut Vec<u8>,
+) -> Result<(), String> {
+    out.reserve(4 + results.len() * 12);
+    out.extend_from_slice(&(results.len() as u32).to_le_bytes());
+    for (id, _) in results {
+        let id: u64 = id
+            .as_str()
+            .parse()
+            .map_err(|_| format!("compact responses require integer IDs, got '{}'", id))?;
+        out.extend_from_slice(&id.to_le_bytes());
+    }
+    for (_, distance) in results {
+        out.extend_from_slice(&distance.to_le_bytes());
+    }
+    Ok(())
+}
+
+fn compact_response(body: Vec<u8>) -> Response {
+    (
+        [(axum::http::header::CONTENT_TYPE, "application/octet-stream")],
+        body,
+    )
+        .into_response()
+}
+
+/// Run each search request and concatenate their compact blocks into one body.
+fn run_compact_search(
+    collection: &Collection,
+    queries: impl IntoIterator<Item = SearchRequest>,
+) -> Result<Vec<u8>, String> {
+    let mut body = Vec::new();
+    for query in queries {
+        let results = collection
+            .search_ids_with_strategy(
+                &query.vector,
+                query.k,
+                query.filter.as_ref(),
+                query.filter_strategy.unwrap_or_default(),
             )
-        })?;
+            .map_err(|e| e.to_string())?;
+        encode_compact(&results, &mut body)?;
+    }
+    Ok(body)
+}
 
-        match result {
-            Ok(results) => {
-                let map_start = Instant::now();
-                let response: Vec<SearchResult> = results
-                    .into_iter()
-                    .map(|(id, distance)| SearchResult {
-                        id: id.as_str().to_string(),
-                        distance,
-                        metadata: None,
-                    })
-                    .collect();
-                let work_ms = work_start.elapsed().as_secs_f64() * 1000.0;
-                let map_ms = map_start.elapsed().as_secs_f64() * 1000.0;
-                let total_ms = handler_start.elapsed().as_secs_f64() * 1000.0;
-                log_perf("search_vector", total_ms, work_ms, Some(map_ms), Some(response.len()));
-                Ok(Json(response))
-            }
-            Err(e) => Err((
-                StatusCode::BAD_REQUEST,
-                Json(ErrorResponse {
-                    error: e.to_string(),
-                }),
-            )),
-        }
+/// Run a single search request against a collection and map it to the response shape.
+fn run_search(
+    collection: &Collection,
+    query: SearchRequest,
+) -> Result<Vec<SearchResult>, surgedb_core::Error> {
+    let strategy = query.filter_strategy.unwrap_or_default();
+    if query.include_metadata.unwrap_or(true) {
+        let results = collection.search_with_strategy(
+            &query.vector,
+            query.k,
+            query.filter.as_ref(),
+            strategy,
+        )?;
+        Ok(results
+            .into_iter()
+            .map(|(id, distance, metadata)| SearchResult {
+                id: id.as_str().to_string(),
+                distance,
+                metadata,
+            })
+            .collect())
+    } else {
+        let results = collection.search_ids_with_strategy(
+            &query.vector,
+            query.k,
+            query.filter.as_ref(),
+            strategy,
+        )?;
+        Ok(results
+            .into_iter()
+            .map(|(id, distance)| SearchResult {
+                id: id.as_str().to_string(),
+                distance,
+                metadata: None,
+            })
+            .collect())
+    }
+}
+
+#[utoipa::path(
+    post,
+    path = "/collections/{name}/search/batch",
+    params(
+        ("name" = String, Path, description = "Collection name")
+    ),
+    request_body = BatchSearchRequest,
+    responses(
+        (status = 200, description = "Nearest neighbors for each query, in request order (concatenated binary blocks when response_format is \"compact\")", body = Vec<Vec<SearchResult>>),
+        (status = 400, description = "Invalid request", body = ErrorResponse)
+    ),
+    security(("api_key" = []))
+)]
+async fn batch_search_vector(
+    State(state): State<AppState>,
+    Path(name): Path<String>,
+    Json(payload): Json<BatchSearchRequest>,
+) -> Result<Response, (StatusCode, Json<ErrorResponse>)> {
+    let handler_start = Instant::now();
+    let collection = state.db.get_collection(&name).map_err(|e| {
+        (
+            StatusCode::NOT_FOUND,
+            Json(ErrorResponse {
+                error: e.to_string(),
+            }),
+        )
+    })?;
+
+    let count = payload.queries.len();
+    let work_start = Instant::now();
+
+    if payload.response_format == ResponseFormat::Compact {
+        let result =
+            tokio::task::spawn_blocking(move || run_compact_search(&collection, payload.queries))
+                .await
+                .map_err(|e| {
+                    (
+                        StatusCode::INTERNAL_SERVER_ERROR,
+                        Json(ErrorResponse {
+                            error: e.to_string(),
+                        }),
+                    )
+                })?;
+
+        let work_ms = work_start.elapsed().as_secs_f64() * 1000.0;
+        let total_ms = handler_start.elapsed().as_secs_f64() * 1000.0;
+        log_perf("batch_search_vector", total_ms, work_ms, None, Some(count));
+
+        return match result {
+            Ok(body) => Ok(compact_response(body)),
+            Err(error) => Err((StatusCode::BAD_REQUEST, Json(ErrorResponse { error }))),
+        };
+    }
+
+    let result = tokio::task::spawn_blocking(move || {
+        payload
+            .queries
+            .into_iter()
+            .map(|query| run_search(&collection, query))
+            .collect::<Result<Vec<_>, _>>()
+    })
+    .await
+    .map_err(|e| {
+        (
+            StatusCode::INTERNAL_SERVER_ERROR,
+            Json(ErrorResponse {
+                error: e.to_string(),
+            }),
+        )
+    })?;
+
+    let work_ms = work_start.elapsed().as_secs_f64() * 1000.0;
+    let total_ms = handler_start.elapsed().as_secs_f64() * 1000.0;
+    log_perf("batch_search_vector", total_ms, work_ms, None, Some(count));
+
+    match result {
+        Ok(response) => Ok(Json(response).into_response()),
+        Err(e) => Err((
+            StatusCode::BAD_REQUEST,
+            Json(ErrorResponse {
+                error: e.to_string(),
+            }),
+        )),
     }
 }
@@ -0,0 +1,149 @@
+"""Shared client harness for the workload scripts in this directory."""
+
+import argparse
+import http.client
+import os
+import random
+import struct
+import threading
+import time
+from urllib.parse import urlsplit
+
+try:
+    import numpy as np
+except ImportError:
+    # Stdlib-only fallback: same requests, slower setup and reporting
+    np = None
+
+try:
+    import orjson
+
+    def dumps(payload):
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+except ImportError:
+    import json
+
+    def dumps(payload):
+        return json.dumps(payload, default=lambda o: o.tolist()).encode("utf-8")
+
+
+BASE_URL = "http://localhost:3000"
+HEADERS = {"Content-Type": "application/json"}
+
+
+def connect():
+    # One persistent HTTP/1.1 connection; every request reuses it (keep-alive).
+    url = urlsplit(BASE_URL)
+    return http.client.HTTPConnection(url.hostname, url.port, timeout=30)
+
+
+def request(conn, method, path, payload=None, allow=()):
+    # bytes payloads are pre-serialised bodies and are sent as-is
+    if payload is None or isinstance(payload, bytes):
+        data = payload
+    else:
+        data = dumps(payload)
+    conn.request(method, path, body=data, headers=HEADERS)
+    resp = conn.getresponse()
+    body = resp.read()
+    # Fail loudly: an error reply would otherwise count as a fast successful op.
+    if resp.status >= 400 and resp.status not in allow:
+        raise RuntimeError(f"{method} {path} -> HTTP {resp.status}: {body[:200]!r}")
+    return resp.status, body
+
+
+_local = threading.local()
+
+
+def timed_request(method, path, payload):
+    # Each worker thread keeps its own keep-alive connection.
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = connect()
+    # Integer nanoseconds; converted to ms once, vectorised, at report time.
+    t0 = time.perf_counter_ns()
+    request(conn, method, path, payload)
+    return time.perf_counter_ns() - t0
+
+
+def make_rng(seed):
+    return np.random.default_rng(seed) if np is not None else random.Random(seed)
+
+
+def to_ms(latencies_ns):
+    if np is not None:
+        return np.array(latencies_ns, dtype=np.int64) / 1e6
+    return [x / 1e6 for x in latencies_ns]
+
+
+def percentiles(latencies_ms, pcts=(0.5, 0.95)):
+    # Lower-index percentiles; with NumPy via introselect: O(n), no full sort.
+    if not len(latencies_ms):
+        return [0.0] * len(pcts)
+    idx = [int(p * (len(latencies_ms) - 1)) for p in pcts]
+    if np is None:
+        ordered = sorted(latencies_ms)
+        return [ordered[i] for i in idx]
+    return np.partition(latencies_ms, idx)[idx]
+
+
+def vector_template(**fields):
+    # Serialise the constant fields once; per op only the vector is encoded,
+    # as prefix + dumps(vector) + suffix.
+    return b'{"vector":', b"," + dumps(fields)[1:]
+
+
+def random_vectors(rng, count, dimensions):
+    if np is not None:
+        # One contiguous (count, dimensions) block, sliced per op.
+        return rng.random((count, dimensions), dtype=np.float32)
+    # One getrandbits call per vector instead of one rng.random() per element
+    unpack = struct.Struct(f"<{dimensions}I").unpack
+    size = 4 * dimensions
+    vectors = []
+    for _ in range(count):
+        raw = rng.getrandbits(8 * size).to_bytes(size, "little")
+        vectors.append([x / 4294967296.0 for x in unpack(raw)])
+    return vectors
+
+
+def cpus_allowed():
+    # The kernel's view of where this process may run, e.g. "0" once pinned
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("Cpus_allowed_list:"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return "unknown"
+
+
+def pin_client():
+    # One core plus SCHED_FIFO keeps the client from being descheduled by the
+    # server's workers, so P95 reflects the server rather than scheduler jitter.
+    # Worker threads inherit both settings from the main thread.
+    if not hasattr(os, "sched_setaffinity"):
+        raise SystemExit("--pin requires Linux (os.sched_setaffinity)")
+    # Lowest CPU this process may use (CPU 0 unless confined by a cpuset);
+    # run the server on other cores (see README)
+    cpu = min(os.sched_getaffinity(0))
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError as e:
+        raise SystemExit(f"--pin could not pin the client to CPU {cpu}: {e}")
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+    except PermissionError:
+        print("SCHED_FIFO needs root or CAP_SYS_NICE; pinned without it")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--pin",
+        action="store_true",
+        help="pin the client to its lowest allowed CPU with SCHED_FIFO (Linux)",
+    )
+    return parser.parse_args()
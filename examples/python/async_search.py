@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from surgedb import SurgeClient
+
+from _bench import make_rng, np, percentiles, random_vectors, to_ms
+
+DIMENSIONS = 384
+COUNT = 10000
+QUERIES = 2000
+K = 10
+# Searches kept in flight at once; they queue on the bindings' worker pool
+IN_FLIGHT = 64
+
+
+def as_lists(vectors):
+    # search_async takes a float sequence; convert NumPy rows once, up front
+    return vectors.tolist() if np is not None else vectors
+
+
+async def run(client, queries):
+    latencies = []
+
+    async def timed_search(query):
+        t0 = time.perf_counter_ns()
+        await client.search_async(query, K)
+        latencies.append(time.perf_counter_ns() - t0)
+
+    start = time.perf_counter_ns()
+    for i in range(0, len(queries), IN_FLIGHT):
+        await asyncio.gather(
+            *(timed_search(query) for query in queries[i : i + IN_FLIGHT])
+        )
+    duration = (time.perf_counter_ns() - start) / 1e9
+    return duration, latencies
+
+
+def main():
+    rng = make_rng(42)
+    client = SurgeClient.new_in_memory(dimensions=DIMENSIONS)
+    for i, vector in enumerate(as_lists(random_vectors(rng, COUNT, DIMENSIONS))):
+        client.insert_u64(i, vector, None)
+    queries = as_lists(random_vectors(rng, QUERIES, DIMENSIONS))
+
+    duration, latencies = asyncio.run(run(client, queries))
+    p50, p95 = percentiles(to_ms(latencies))
+
+    print("SurgeDB Async Search Example")
+    print("----------------------------")
+    print(f"Vectors: {COUNT}, Queries: {QUERIES}, in flight: {IN_FLIGHT}")
+    print(f"QPS: {QUERIES / duration:.2f}")
+    print(f"P50: {p50:.2f} ms | P95: {p95:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
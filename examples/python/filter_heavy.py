@@ -1,37 +1,88 @@
-import json
-import random
 import time
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from _bench import (
+    connect,
+    cpus_allowed,
+    dumps,
+    make_rng,
+    np,
+    parse_args,
+    percentiles,
+    pin_client,
+    random_vectors,
+    request,
+    timed_request,
+    to_ms,
+    vector_template,
+)
 
-BASE_URL = "http://localhost:3000"
 COLLECTION = "filter_heavy"
 DIMENSIONS = 384
 PREFILL = 20000
 K = 10
 QUERIES = 5000
+SEARCH_BATCH = 50
+CONCURRENCY = 32
+# "tag" matches half the collection, "bucket" 1 in 20 (below the 10% pre-filter cutoff)
+FILTERS = [
+    ("tag=even", {"Exact": ["tag", "even"]}),
+    ("bucket=0", {"Exact": ["bucket", 0]}),
+]
+STRATEGIES = ["Pre", "Post", "Auto"]
 
 
-def request(method, path, payload=None):
-    url = f"{BASE_URL}{path}"
-    data = json.dumps(payload).encode("utf-8") if payload is not None else None
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method=method,
+def run_strategy(path, query_pool, search_filter, strategy):
+    prefix, suffix = vector_template(
+        k=K,
+        filter=search_filter,
+        filter_strategy=strategy,
+        include_metadata=False,
     )
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return resp.status, resp.read()
+    queries = [prefix + dumps(query_pool[i]) + suffix for i in range(QUERIES)]
+    batches = [
+        b'{"response_format":"compact","queries":['
+        + b",".join(queries[i : i + SEARCH_BATCH])
+        + b"]}"
+        for i in range(0, QUERIES, SEARCH_BATCH)
+    ]
 
+    start = time.perf_counter_ns()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        batch_latencies = list(
+            executor.map(
+                lambda body: timed_request("POST", path, body),
+                batches,
+            )
+        )
+    duration = (time.perf_counter_ns() - start) / 1e9
 
-def random_vector(rng):
-    return [rng.random() for _ in range(DIMENSIONS)]
+    # Per-query latency is the batch wall time amortised over its queries.
+    sizes = [min(SEARCH_BATCH, QUERIES - i) for i in range(0, QUERIES, SEARCH_BATCH)]
+    batch_ms = to_ms(batch_latencies)
+    if np is not None:
+        latencies_ms = np.repeat(batch_ms / sizes, sizes)
+    else:
+        latencies_ms = [
+            ms / size for ms, size in zip(batch_ms, sizes) for _ in range(size)
+        ]
+    qps = QUERIES / duration
+    p50, p95 = percentiles(latencies_ms)
+    return qps, p50, p95
 
 
 def main():
-    rng = random.Random(7)
-    request("DELETE", f"/collections/{COLLECTION}")
-    status, _ = request(
+    args = parse_args()
+    if args.pin:
+        pin_client()
+    print(f"Client Cpus_allowed_list: {cpus_allowed()}")
+
+    conn = connect()
+    rng = make_rng(7)
+    # The collection may not exist yet; every other request must succeed.
+    request(conn, "DELETE", f"/collections/{COLLECTION}", allow=(404,))
+    request(
+        conn,
         "POST",
         "/collections",
         {
@@ -40,23 +91,26 @@ def main():
             "distance_metric": "Cosine",
         },
     )
-    if status >= 400:
-        raise SystemExit("Failed to create collection")
+
+    prefill_pool = random_vectors(rng, PREFILL, DIMENSIONS)
+    query_pool = random_vectors(rng, QUERIES, DIMENSIONS)
 
     batch = []
     for i in range(PREFILL):
         batch.append(
             {
-                "id": f"vec_{i}",
-                "vector": random_vector(rng),
+                "id": i,
+                "vector": prefill_pool[i],
                 "metadata": {
                     "tag": "even" if i % 2 == 0 else "odd",
+                    "bucket": i % 20,
                     "score": float(i),
                 },
             }
         )
         if len(batch) == 200:
             request(
+                conn,
                 "POST",
                 f"/collections/{COLLECTION}/vectors/batch",
                 {"vectors": batch},
@@ -64,32 +118,22 @@ def main():
             batch = []
     if batch:
         request(
+            conn,
             "POST",
             f"/collections/{COLLECTION}/vectors/batch",
             {"vectors": batch},
         )
 
-    latencies = []
-    start = time.perf_counter()
-    for _ in range(QUERIES):
-        payload = {
-            "vector": random_vector(rng),
-            "k": K,
-            "filter": {"Exact": ["tag", "even"]},
-            "include_metadata": False,
-        }
-        t0 = time.perf_counter()
-        request("POST", f"/collections/{COLLECTION}/search", payload)
-        latencies.append(time.perf_counter() - t0)
-
-    duration = time.perf_counter() - start
-    qps = QUERIES / duration
-    latencies_ms = sorted([x * 1000.0 for x in latencies])
-    p50 = latencies_ms[int(0.5 * (len(latencies_ms) - 1))]
-    p95 = latencies_ms[int(0.95 * (len(latencies_ms) - 1))]
+    path = f"/collections/{COLLECTION}/search/batch"
 
-    print(f"Filter-heavy QPS: {qps:.2f}")
-    print(f"P50: {p50:.2f} ms | P95: {p95:.2f} ms")
+    header = f"{'Filter':<10} {'Strategy':<8} {'QPS':>10} {'P50 (ms)':>10} {'P95 (ms)':>10}"
+    print(header)
+    for filter_name, search_filter in FILTERS:
+        for strategy in STRATEGIES:
+            qps, p50, p95 = run_strategy(path, query_pool, search_filter, strategy)
+            print(
+                f"{filter_name:<10} {strategy:<8} {qps:>10.2f} {p50:>10.2f} {p95:>10.2f}"
+            )
 
 
 if __name__ == "__main__":
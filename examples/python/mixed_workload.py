@@ -1,9 +1,22 @@
-import json
-import random
 import time
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from _bench import (
+    connect,
+    cpus_allowed,
+    dumps,
+    make_rng,
+    np,
+    parse_args,
+    percentiles,
+    pin_client,
+    random_vectors,
+    request,
+    timed_request,
+    to_ms,
+    vector_template,
+)
 
-BASE_URL = "http://localhost:3000"
 COLLECTION = "mixed_workload"
 DIMENSIONS = 384
 PREFILL = 10000
@@ -11,29 +24,21 @@ OPS = 10000
 SEARCH_RATIO = 0.7
 INSERT_RATIO = 0.3
 K = 10
-
-
-def request(method, path, payload=None):
-    url = f"{BASE_URL}{path}"
-    data = json.dumps(payload).encode("utf-8") if payload is not None else None
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method=method,
-    )
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return resp.status, resp.read()
-
-
-def random_vector(rng):
-    return [rng.random() for _ in range(DIMENSIONS)]
+CONCURRENCY = 32
 
 
 def main():
-    rng = random.Random(123)
-    request("DELETE", f"/collections/{COLLECTION}")
-    status, _ = request(
+    args = parse_args()
+    if args.pin:
+        pin_client()
+    print(f"Client Cpus_allowed_list: {cpus_allowed()}")
+
+    conn = connect()
+    rng = make_rng(123)
+    # The collection may not exist yet; every other request must succeed.
+    request(conn, "DELETE", f"/collections/{COLLECTION}", allow=(404,))
+    request(
+        conn,
         "POST",
         "/collections",
         {
@@ -42,20 +47,26 @@ def main():
             "distance_metric": "Cosine",
         },
     )
-    if status >= 400:
-        raise SystemExit("Failed to create collection")
+
+    prefill_pool = random_vectors(rng, PREFILL, DIMENSIONS)
+    op_pool = random_vectors(rng, OPS, DIMENSIONS)
+    if np is not None:
+        is_search = rng.random(OPS) < SEARCH_RATIO
+    else:
+        is_search = [rng.random() < SEARCH_RATIO for _ in range(OPS)]
 
     batch = []
     for i in range(PREFILL):
         batch.append(
             {
-                "id": f"vec_{i}",
-                "vector": random_vector(rng),
+                "id": i,
+                "vector": prefill_pool[i],
                 "metadata": {"tag": "even" if i % 2 == 0 else "odd"},
             }
         )
         if len(batch) == 200:
             request(
+                conn,
                 "POST",
                 f"/collections/{COLLECTION}/vectors/batch",
                 {"vectors": batch},
@@ -63,51 +74,49 @@ def main():
             batch = []
     if batch:
         request(
+            conn,
             "POST",
             f"/collections/{COLLECTION}/vectors/batch",
             {"vectors": batch},
         )
 
-    search_lat = []
-    insert_lat = []
-    start = time.perf_counter()
+    # Two body templates: searches vary only in the vector, inserts in the
+    # vector and the trailing integer id.
+    search_prefix, search_suffix = vector_template(
+        k=K, include_metadata=False, response_format="compact"
+    )
+    insert_prefix, insert_suffix = vector_template(metadata={"tag": "live"})
+    insert_suffix = insert_suffix[:-1] + b',"id":'
 
+    ops = []
     for i in range(OPS):
-        if rng.random() < SEARCH_RATIO:
-            payload = {
-                "vector": random_vector(rng),
-                "k": K,
-                "include_metadata": False,
-            }
-            t0 = time.perf_counter()
-            request("POST", f"/collections/{COLLECTION}/search", payload)
-            search_lat.append(time.perf_counter() - t0)
+        vector = dumps(op_pool[i])
+        if is_search[i]:
+            payload = search_prefix + vector + search_suffix
+            ops.append((f"/collections/{COLLECTION}/search", payload))
         else:
-            payload = {
-                "id": f"insert_{i}",
-                "vector": random_vector(rng),
-                "metadata": {"tag": "live"},
-            }
-            t0 = time.perf_counter()
-            request("POST", f"/collections/{COLLECTION}/vectors", payload)
-            insert_lat.append(time.perf_counter() - t0)
+            payload = insert_prefix + vector + insert_suffix + b"%d}" % (PREFILL + i)
+            ops.append((f"/collections/{COLLECTION}/vectors", payload))
 
-    duration = time.perf_counter() - start
+    start = time.perf_counter_ns()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        latencies = list(
+            executor.map(lambda op: timed_request("POST", op[0], op[1]), ops)
+        )
+    duration = (time.perf_counter_ns() - start) / 1e9
     qps = OPS / duration
 
-    def percentile(data, pct):
-        if not data:
-            return 0.0
-        data_ms = sorted([x * 1000.0 for x in data])
-        return data_ms[int(pct * (len(data_ms) - 1))]
+    search_lat = to_ms([lat for lat, search in zip(latencies, is_search) if search])
+    insert_lat = to_ms(
+        [lat for lat, search in zip(latencies, is_search) if not search]
+    )
+
+    search_p50, search_p95 = percentiles(search_lat)
+    insert_p50, insert_p95 = percentiles(insert_lat)
 
     print(f"Mixed QPS: {qps:.2f}")
-    print(
-        f"Search P50/P95: {percentile(search_lat, 0.5):.2f} / {percentile(search_lat, 0.95):.2f} ms"
-    )
-    print(
-        f"Insert P50/P95: {percentile(insert_lat, 0.5):.2f} / {percentile(insert_lat, 0.95):.2f} ms"
-    )
+    print(f"Search P50/P95: {search_p50:.2f} / {search_p95:.2f} ms")
+    print(f"Insert P50/P95: {insert_p50:.2f} / {insert_p95:.2f} ms")
 
 
 if __name__ == "__main__":
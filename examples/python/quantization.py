@@ -0,0 +1,105 @@
+import random
+import sys
+import time
+from array import array
+
+from surgedb import (
+    DistanceMetric,
+    Quantization,
+    SurgeClient,
+    SurgeConfig,
+    system_info,
+)
+
+DIMENSIONS = 768
+COUNT = 5000
+QUERIES = 100
+K = 10
+# HNSW search breadth: raise for recall, lower for latency
+EF_SEARCH = 128
+
+# U8_VNNI stores vectors like SQ8 but quantizes the query as well, so search
+# distances run on u8 x u8 integer kernels instead of widening to f32.
+# SQFP16 halves memory instead of quartering it, for when SQ8 recall is too low.
+MODES = [
+    ("SQ8", Quantization.SQ8),
+    ("U8_VNNI", Quantization.U8_VNNI),
+    ("SQFP16", Quantization.SQFP16),
+]
+
+
+def random_vector(rng):
+    return [rng.uniform(-1.0, 1.0) for _ in range(DIMENSIONS)]
+
+
+def flatten(vectors):
+    # One little-endian f32 buffer for the whole batch: a single FFI call
+    # instead of marshalling a Python float list per vector.
+    flat = array("f")
+    for vector in vectors:
+        flat.extend(vector)
+    if sys.byteorder == "big":
+        flat.byteswap()
+    return flat.tobytes()
+
+
+def build(quantization, vectors):
+    config = SurgeConfig(
+        dimensions=DIMENSIONS,
+        distance_metric=DistanceMetric.COSINE,
+        quantization=quantization,
+        persistent=False,
+        data_path=None,
+        ef_search=EF_SEARCH,
+    )
+    client = SurgeClient.open("", config)
+    client.upsert_batch_flat(
+        [f"vec_{i}" for i in range(len(vectors))],
+        flatten(vectors),
+        [None] * len(vectors),
+    )
+    return client
+
+
+def run_queries(client, queries):
+    # Queries go over as packed f32 bytes, skipping the per-float list marshalling
+    encoded = [flatten([query]) for query in queries]
+    results = []
+    start = time.perf_counter()
+    for query in encoded:
+        results.append([r.id for r in client.search_buf(query, K)])
+    duration = time.perf_counter() - start
+    return results, duration / len(queries)
+
+
+def main():
+    rng = random.Random(42)
+    vectors = [random_vector(rng) for _ in range(COUNT)]
+    queries = [random_vector(rng) for _ in range(QUERIES)]
+
+    print("SurgeDB Quantization Example")
+    print("----------------------------")
+    print(f"Vectors: {COUNT}, Dimensions: {DIMENSIONS}, k={K}")
+    # Tag results with the u8 kernel chosen for this CPU
+    for line in system_info().splitlines():
+        if line.startswith("cpu_kernel:"):
+            print(line)
+
+    # Full-precision results are the reference for recall
+    baseline = build(Quantization.NONE, vectors)
+    expected, _ = run_queries(baseline, queries)
+
+    print(f"\n{'Mode':<10} {'Ratio':>8} {'Search (us)':>12} {'Recall':>8}")
+    for name, quantization in MODES:
+        client = build(quantization, vectors)
+        results, latency = run_queries(client, queries)
+
+        hits = sum(len(set(r) & set(e)) for r, e in zip(results, expected))
+        recall = hits / (len(queries) * K)
+        ratio = client.stats().compression_ratio
+
+        print(f"{name:<10} {ratio:>7.2f}x {latency * 1e6:>12.1f} {recall:>8.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,41 @@
-import json
-import random
 import time
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from _bench import (
+    connect,
+    cpus_allowed,
+    dumps,
+    make_rng,
+    parse_args,
+    percentiles,
+    pin_client,
+    random_vectors,
+    request,
+    timed_request,
+    to_ms,
+    vector_template,
+)
 
-BASE_URL = "http://localhost:3000"
 COLLECTION = "search_heavy"
 DIMENSIONS = 384
 PREFILL = 20000
 K = 10
 QUERIES = 5000
-
-
-def request(method, path, payload=None):
-    url = f"{BASE_URL}{path}"
-    data = json.dumps(payload).encode("utf-8") if payload is not None else None
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method=method,
-    )
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return resp.status, resp.read()
-
-
-def random_vector(rng):
-    return [rng.random() for _ in range(DIMENSIONS)]
+CONCURRENCY = 32
 
 
 def main():
-    rng = random.Random(42)
-    request("DELETE", f"/collections/{COLLECTION}")
-    status, _ = request(
+    args = parse_args()
+    if args.pin:
+        pin_client()
+    print(f"Client Cpus_allowed_list: {cpus_allowed()}")
+
+    conn = connect()
+    rng = make_rng(42)
+    # The collection may not exist yet; every other request must succeed.
+    request(conn, "DELETE", f"/collections/{COLLECTION}", allow=(404,))
+    request(
+        conn,
         "POST",
         "/collections",
         {
@@ -40,20 +44,22 @@ def main():
             "distance_metric": "Cosine",
         },
     )
-    if status >= 400:
-        raise SystemExit("Failed to create collection")
+
+    prefill_pool = random_vectors(rng, PREFILL, DIMENSIONS)
+    query_pool = random_vectors(rng, QUERIES, DIMENSIONS)
 
     batch = []
     for i in range(PREFILL):
         batch.append(
             {
-                "id": f"vec_{i}",
-                "vector": random_vector(rng),
+                "id": i,
+                "vector": prefill_pool[i],
                 "metadata": {"tag": "even" if i % 2 == 0 else "odd"},
             }
         )
         if len(batch) == 200:
             request(
+                conn,
                 "POST",
                 f"/collections/{COLLECTION}/vectors/batch",
                 {"vectors": batch},
@@ -61,28 +67,28 @@ def main():
             batch = []
     if batch:
         request(
+            conn,
             "POST",
             f"/collections/{COLLECTION}/vectors/batch",
             {"vectors": batch},
         )
 
-    latencies = []
-    start = time.perf_counter()
-    for _ in range(QUERIES):
-        payload = {
-            "vector": random_vector(rng),
-            "k": K,
-            "include_metadata": False,
-        }
-        t0 = time.perf_counter()
-        request("POST", f"/collections/{COLLECTION}/search", payload)
-        latencies.append(time.perf_counter() - t0)
+    prefix, suffix = vector_template(
+        k=K, include_metadata=False, response_format="compact"
+    )
+    payloads = [prefix + dumps(query_pool[i]) + suffix for i in range(QUERIES)]
+    path = f"/collections/{COLLECTION}/search"
+
+    start = time.perf_counter_ns()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        latencies = list(
+            executor.map(lambda payload: timed_request("POST", path, payload), payloads)
+        )
 
-    duration = time.perf_counter() - start
+    duration = (time.perf_counter_ns() - start) / 1e9
     qps = QUERIES / duration
-    latencies_ms = sorted([x * 1000.0 for x in latencies])
-    p50 = latencies_ms[int(0.5 * (len(latencies_ms) - 1))]
-    p95 = latencies_ms[int(0.95 * (len(latencies_ms) - 1))]
+    latencies_ms = to_ms(latencies)
+    p50, p95 = percentiles(latencies_ms)
 
     print(f"Search-heavy QPS: {qps:.2f}")
     print(f"P50: {p50:.2f} ms | P95: {p95:.2f} ms")